@@ -3,21 +3,60 @@ from typing import Optional
 from fastapi import Request, HTTPException
 from app.api.models.requests import HeaderData
 
+# ASGI header keys are lowercase bytes; compare raw, decode only what we use
+_H_USER_ID = b"x-user-id"
+_H_ORG_ID = b"x-organization-id"
+
 
 class BaseController(ABC):
     """Base controller class with common functionality."""
-    
+
+    __slots__ = ()
+
     def __init__(self):
         pass
     
+    @staticmethod
+    async def read_body(request: Request) -> bytes:
+        """Read the request body, pre-allocating from Content-Length.
+
+        Starlette's request.body() grows a bytearray chunk by chunk with
+        geometric reallocation; when the client sent Content-Length we can
+        allocate the buffer once and write chunks at their offset.
+        """
+        content_length = None
+        for key, value in request.scope["headers"]:
+            if key == b"content-length":
+                content_length = value
+                break
+        if content_length is None:
+            return await request.body()
+
+        try:
+            size = int(content_length)
+        except ValueError:
+            return await request.body()
+
+        buffer = bytearray(size)
+        position = 0
+        async for chunk in request.stream():
+            buffer[position:position + len(chunk)] = chunk
+            position += len(chunk)
+        return bytes(buffer)
+
     @staticmethod
     def extract_headers(request: Request) -> HeaderData:
         """Extract common headers from request."""
-        headers = request.headers
-        return HeaderData(
-            user_id=headers.get("X-User-Id"),
-            organization_id=headers.get("X-Organization-Id")
-        )
+        # Scan the raw (bytes, bytes) header list once instead of building
+        # Starlette's Headers wrapper; decode only the two values we need
+        user_id = None
+        organization_id = None
+        for key, value in request.scope["headers"]:
+            if key == _H_USER_ID:
+                user_id = value.decode("ascii", "replace")
+            elif key == _H_ORG_ID:
+                organization_id = value.decode("ascii", "replace")
+        return HeaderData(user_id=user_id, organization_id=organization_id)
     
     @staticmethod
     def require_organization_id(organization_id: Optional[str]) -> str:
@@ -1,13 +1,20 @@
+import msgspec
 from fastapi import Request
 from app.api.controllers.base import BaseController
 from app.api.services.document import DocumentService
 from app.api.models.requests import GenerateUploadUrlRequest, IndexDocRequest
 from app.api.models.responses import GenerateUploadUrlResponse, IndexDocResponse
 
+# Pre-built decoders combine JSON parsing and validation in one pass
+_upload_decoder = msgspec.json.Decoder(GenerateUploadUrlRequest)
+_index_decoder = msgspec.json.Decoder(IndexDocRequest)
+
 
 class DocumentController(BaseController):
     """Controller for document-related operations."""
-    
+
+    __slots__ = ("document_service",)
+
     def __init__(self):
         super().__init__()
         self.document_service = DocumentService()
@@ -15,15 +22,33 @@ class DocumentController(BaseController):
     async def generate_upload_url(self, request: Request) -> GenerateUploadUrlResponse:
         """Generate a pre-signed upload URL for document upload."""
         headers = self.extract_headers(request)
-        body = await request.json()
-        request_data = GenerateUploadUrlRequest(**body)
-        
+        # Both ids go into the object path, so absent headers must 400
+        # here instead of failing the path join downstream
+        self.require_organization_id(headers.organization_id)
+        self.require_user_id(headers.user_id)
+        request_data = self._parsed_body(request)
+        if request_data is None:
+            request_data = _upload_decoder.decode(await self.read_body(request))
+            request.state.parsed_body = request_data
+
         return self.document_service.generate_upload_url(request_data, headers)
-    
+
     async def index_document(self, request: Request) -> IndexDocResponse:
         """Dispatch document indexing task."""
         headers = self.extract_headers(request)
-        body = await request.json()
-        request_data = IndexDocRequest(**body)
-        
+        request_data = self._parsed_body(request)
+        if request_data is None:
+            request_data = _index_decoder.decode(await self.read_body(request))
+            request.state.parsed_body = request_data
+
         return self.document_service.index_document(request_data, headers)
+
+    @staticmethod
+    def _parsed_body(request: Request):
+        """Return the payload already decoded for this request, if any.
+
+        Guards against paying the body decode twice when a handler is
+        re-entered for the same request (e.g. via internal redirects or
+        shared dependencies).
+        """
+        return getattr(request.state, "parsed_body", None)
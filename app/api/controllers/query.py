@@ -1,4 +1,6 @@
+import orjson
 from fastapi import Request
+from fastapi.responses import StreamingResponse
 from app.api.controllers.base import BaseController
 from app.api.services.query import QueryService
 from app.api.models.requests import QueryRequest
@@ -7,7 +9,9 @@ from app.api.models.responses import QueryResponse
 
 class QueryController(BaseController):
     """Controller for query-related operations."""
-    
+
+    __slots__ = ("query_service",)
+
     def __init__(self):
         super().__init__()
         self.query_service = QueryService()
@@ -15,8 +19,27 @@ class QueryController(BaseController):
     async def execute_query(self, request: Request, request_data: QueryRequest) -> QueryResponse:
         """Execute a query against specified targets."""
         headers = self.extract_headers(request)
-        return self.query_service.execute_query(
-            request_data, 
+        return await self.query_service.execute_query(
+            request_data,
             organization_id=headers.organization_id,
             user_id=headers.user_id
         )
+
+    async def stream_query(self, request: Request, request_data: QueryRequest) -> StreamingResponse:
+        """Execute a query and stream the answer as server-sent events."""
+        headers = self.extract_headers(request)
+
+        async def event_stream():
+            try:
+                async for chunk in self.query_service.stream_query(
+                    request_data,
+                    organization_id=headers.organization_id,
+                    user_id=headers.user_id
+                ):
+                    yield b"data: " + orjson.dumps({"delta": chunk}) + b"\n\n"
+            except ValueError as e:
+                # Same domain errors execute_query reports in the answer body
+                yield b"data: " + orjson.dumps({"error": str(e)}) + b"\n\n"
+            yield b"data: [DONE]\n\n"
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
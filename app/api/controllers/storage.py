@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import Request
 from app.api.controllers.base import BaseController
 from app.api.services.storage import StorageService
@@ -6,7 +7,9 @@ from app.api.models.responses import CreateBucketResponse, ListBucketsResponse
 
 class StorageController(BaseController):
     """Controller for storage-related operations."""
-    
+
+    __slots__ = ("storage_service",)
+
     def __init__(self):
         super().__init__()
         self.storage_service = StorageService()
@@ -15,9 +18,12 @@ class StorageController(BaseController):
         """Create a MinIO bucket for an organization."""
         headers = self.extract_headers(request)
         organization_id = self.require_organization_id(headers.organization_id)
-        
-        return self.storage_service.create_organization_bucket(organization_id)
-    
-    def list_buckets(self) -> ListBucketsResponse:
+
+        # MinIO SDK calls block; keep them off the event loop
+        return await asyncio.to_thread(
+            self.storage_service.create_organization_bucket, organization_id
+        )
+
+    async def list_buckets(self) -> ListBucketsResponse:
         """List all available buckets in MinIO."""
-        return self.storage_service.list_all_buckets()
+        return await asyncio.to_thread(self.storage_service.list_all_buckets)
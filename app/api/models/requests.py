@@ -1,14 +1,17 @@
+import msgspec
 from pydantic import BaseModel, Field
-from typing import Optional, List, Literal
+from typing import NamedTuple, Optional, List, Literal
 
 
-class GenerateUploadUrlRequest(BaseModel):
-    doc_type: str = Field(..., description="Document type (pdf, txt, etc.)")
+class GenerateUploadUrlRequest(msgspec.Struct):
+    """Decoded with msgspec for a single JSON parse + validation pass."""
+    doc_type: str
 
 
-class IndexDocRequest(BaseModel):
-    doc_id: str = Field(..., description="Document ID")
-    object_path: str = Field(..., description="Object path in storage")
+class IndexDocRequest(msgspec.Struct):
+    """Decoded with msgspec for a single JSON parse + validation pass."""
+    doc_id: str
+    object_path: str
 
 
 class QueryRequest(BaseModel):
@@ -16,6 +19,11 @@ class QueryRequest(BaseModel):
     targets: List[Literal["docstore", "sql"]] = Field(..., description="Target systems to query")
 
 
-class HeaderData(BaseModel):
-    user_id: Optional[str] = Field(None, description="User ID from X-User-Id header")
-    organization_id: Optional[str] = Field(None, description="Organization ID from X-Organization-Id header")
+class HeaderData(NamedTuple):
+    """Header values carried between controller and service layers.
+
+    A plain named tuple: these are two already-parsed strings, so pydantic
+    validation on every request would be pure overhead.
+    """
+    user_id: Optional[str] = None
+    organization_id: Optional[str] = None
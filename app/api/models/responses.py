@@ -1,58 +1,59 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
-
-class BaseResponse(BaseModel):
-    status: str = Field(..., description="Response status")
+# Response models are built from service-owned data; Field descriptions only
+# bloat the pydantic-core schemas built at import time, so plain annotations
+# are used here. Descriptions stay on the inbound request models where they
+# feed the OpenAPI docs.
 
 
-class HealthResponse(BaseResponse):
-    status: str = "healthy"
+class BaseResponse(BaseModel):
+    status: str
 
 
 class GenerateUploadUrlResponse(BaseModel):
-    doc_id: str = Field(..., description="Generated document ID")
-    upload_url: str = Field(..., description="Pre-signed upload URL")
-    object_path: str = Field(..., description="Object path in storage")
+    doc_id: str
+    upload_url: str
+    object_path: str
 
 
 class IndexDocResponse(BaseResponse):
-    doc_id: str = Field(..., description="Document ID")
-    status: str = Field(default="Indexing dispatched", description="Operation status")
+    doc_id: str
+    status: str = "Indexing dispatched"
 
 
 class QueryResponse(BaseModel):
-    answer: str = Field(..., description="The answer to the query")
-    sources: Optional[List[str]] = Field(default=None, description="Sources used to generate the answer")
+    answer: str
+    sources: Optional[List[str]] = None
 
 
 class BucketInfo(BaseModel):
-    name: str = Field(..., description="Bucket name")
-    creation_date: Optional[str] = Field(None, description="Bucket creation date")
+    name: str
+    creation_date: Optional[str] = None
 
 
 class ListBucketsResponse(BaseModel):
-    buckets: List[BucketInfo] = Field(default_factory=list, description="List of available buckets")
+    buckets: List[BucketInfo] = []
 
 
 class CreateBucketResponse(BaseModel):
-    organization_id: str = Field(..., description="Organization ID")
-    bucket_name: str = Field(..., description="Created bucket name")
-    status: str = Field(..., description="Operation status")
-    message: str = Field(..., description="Operation message")
+    organization_id: str
+    bucket_name: str
+    status: str
+    message: str
 
 
 class OrganizationStats(BaseModel):
-    factory_instance_id: str = Field(..., description="Factory instance ID")
-    multi_tenant_stats: Dict[str, Any] = Field(default_factory=dict, description="Multi-tenant statistics")
+    factory_instance_id: str
+    multi_tenant_stats: Dict[str, Any] = {}
 
 
 class CreateCollectionResponse(BaseModel):
-    success: bool = Field(..., description="Whether the collection creation was successful")
-    message: str = Field(..., description="Status message")
-    collection_name: str = Field(..., description="Name of the Qdrant collection")
-    organization_id: str = Field(..., description="Organization ID")
-    points_count: Optional[int] = Field(None, description="Number of points in the collection")
-    vectors_count: Optional[int] = Field(None, description="Number of vectors in the collection")
-    status: Optional[str] = Field(None, description="Collection status")
-    error: Optional[str] = Field(None, description="Error message if creation failed")
+    success: bool
+    message: str
+    collection_name: str
+    organization_id: str
+    points_count: Optional[int] = None
+    vectors_count: Optional[int] = None
+    status: Optional[str] = None
+    error: Optional[str] = None
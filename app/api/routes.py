@@ -1,60 +1,83 @@
-from fastapi import APIRouter, Request
-from app.api.controllers.health import HealthController
+from functools import lru_cache
+import orjson
+from fastapi import APIRouter, Request, Response
 from app.api.controllers.document import DocumentController
 from app.api.controllers.storage import StorageController
 from app.api.controllers.organization import OrganizationController
 from app.api.controllers.query import QueryController
 from app.api.models.requests import QueryRequest
 from app.api.models.responses import (
-    HealthResponse, GenerateUploadUrlResponse, IndexDocResponse,
-    CreateBucketResponse, ListBucketsResponse, OrganizationStats, 
+    GenerateUploadUrlResponse, IndexDocResponse,
+    CreateBucketResponse, ListBucketsResponse, OrganizationStats,
     QueryResponse, CreateCollectionResponse
 )
 router = APIRouter()
 
-# Initialize controllers
-health_controller = HealthController()
-document_controller = DocumentController()
-storage_controller = StorageController()
-organization_controller = OrganizationController()
-query_controller = QueryController()
+# The health payload never changes; serialize it once at import so probe
+# traffic skips pydantic and JSON encoding entirely
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+# Controllers are constructed lazily so endpoints that are never hit don't
+# pay their service/factory initialization cost at import time
+
+@lru_cache(maxsize=1)
+def document_controller() -> DocumentController:
+    return DocumentController()
+
+@lru_cache(maxsize=1)
+def storage_controller() -> StorageController:
+    return StorageController()
+
+@lru_cache(maxsize=1)
+def organization_controller() -> OrganizationController:
+    return OrganizationController()
+
+@lru_cache(maxsize=1)
+def query_controller() -> QueryController:
+    return QueryController()
 
 @router.post("/api/query", response_model=QueryResponse)
 async def execute_query(request: Request, request_data: QueryRequest):
     """Execute a query against specified targets."""
-    return await query_controller.execute_query(request, request_data)
+    return await query_controller().execute_query(request, request_data)
+
+@router.post("/api/query/stream")
+async def stream_query(request: Request, request_data: QueryRequest):
+    """Execute a query, streaming the answer as server-sent events."""
+    return await query_controller().stream_query(request, request_data)
 
-@router.get("/api/health", response_model=HealthResponse)
+@router.get("/api/health")
 async def health():
-    """Health check endpoint."""
-    return health_controller.health_check()
+    """Health check endpoint. Returns a pre-serialized body; a response_model
+    here would force re-validation of a constant payload."""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @router.post("/api/generate-upload-url", response_model=GenerateUploadUrlResponse)
 async def generate_upload_url(request: Request):
     """Generate a pre-signed upload URL for document upload."""
-    return await document_controller.generate_upload_url(request)
+    return await document_controller().generate_upload_url(request)
 
 @router.post("/api/index-doc", response_model=IndexDocResponse)
 async def index_doc(request: Request):
     """Called after client uploads file to MinIO."""
-    return await document_controller.index_document(request)
+    return await document_controller().index_document(request)
 
 @router.post("/api/create-bucket", response_model=CreateBucketResponse)
 async def create_organization_bucket(request: Request):
     """Create a MinIO bucket for an organization using organization ID from header."""
-    return await storage_controller.create_organization_bucket(request)
+    return await storage_controller().create_organization_bucket(request)
 
 @router.get("/api/buckets", response_model=ListBucketsResponse)
 async def get_buckets():
     """List all available buckets in MinIO."""
-    return storage_controller.list_buckets()
+    return await storage_controller().list_buckets()
 
 @router.get("/api/organizations/stats", response_model=OrganizationStats)
 async def get_organization_stats():
     """Get statistics about active organizations in the multi-tenant pipeline."""
-    return organization_controller.get_organization_stats()
+    return await organization_controller().get_organization_stats()
 
 @router.post("/api/organizations/create-collection", response_model=CreateCollectionResponse)
 async def create_organization_collection(request: Request):
     """Create a Qdrant collection for an organization using organization ID from header."""
-    return organization_controller.create_collection(request)
+    return await organization_controller().create_collection(request)
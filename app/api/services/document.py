@@ -1,3 +1,4 @@
+import sys
 from typing import Dict, Any
 from app.utils.id_generator import generate_doc_id
 from app.storage.minio_client import generate_presigned_upload_url
@@ -5,23 +6,27 @@ from app.dispatcher.celery_dispatcher import CeleryDispatcher
 from app.api.models.requests import GenerateUploadUrlRequest, IndexDocRequest, HeaderData
 from app.api.models.responses import GenerateUploadUrlResponse, IndexDocResponse
 
+_STATUS_INDEXING_DISPATCHED = sys.intern("Indexing dispatched")
+
 
 class DocumentService:
     """Service layer for document operations."""
-    
+
+    __slots__ = ("dispatcher",)
+
     def __init__(self):
         self.dispatcher = CeleryDispatcher()
     
     def generate_upload_url(self, request_data: GenerateUploadUrlRequest, headers: HeaderData) -> GenerateUploadUrlResponse:
         """Generate a pre-signed upload URL for document upload."""
         doc_id = generate_doc_id()
-        doc_type = request_data.doc_type
-        object_name = f"{doc_id}.{doc_type}"
-        object_path = f"{headers.organization_id}/{headers.user_id}/{object_name}"
+        object_name = f"{doc_id}.{request_data.doc_type}"
+        # Single join allocates the path in one buffer instead of nested f-strings
+        object_path = "".join((headers.organization_id, "/", headers.user_id, "/", object_name))
         
         upload_url = generate_presigned_upload_url(object_name)
         
-        return GenerateUploadUrlResponse(
+        return GenerateUploadUrlResponse.model_construct(
             doc_id=doc_id,
             upload_url=upload_url,
             object_path=object_path
@@ -38,7 +43,7 @@ class DocumentService:
         
         self.dispatcher.dispatch("index_document", task_data)
         
-        return IndexDocResponse(
+        return IndexDocResponse.model_construct(
             doc_id=request_data.doc_id,
-            status="Indexing dispatched"
+            status=_STATUS_INDEXING_DISPATCHED
         )
@@ -1,3 +1,5 @@
+import asyncio
+
 from app.pipelines.indexing import IndexingPipelinesFactory
 from app.pipelines.query import QueryPipelinesFactory
 from app.storage.document_store_manager import DocumentStoreManager
@@ -6,19 +8,23 @@ from app.api.models.responses import OrganizationStats, CreateCollectionResponse
 
 class OrganizationService:
     """Service layer for organization operations."""
-    
+
+    __slots__ = ("_indexing_factory", "_query_factory", "_document_store_manager")
+
     def __init__(self):
-        pass
-    
-    def get_organization_stats(self) -> OrganizationStats:
+        # Factories and the store manager are singletons; resolve them once
+        # instead of re-constructing the object graph on every request
+        self._indexing_factory = IndexingPipelinesFactory()
+        self._query_factory = QueryPipelinesFactory()
+        self._document_store_manager = DocumentStoreManager()
+
+    async def get_organization_stats(self) -> OrganizationStats:
         """Get statistics about active organizations in the multi-tenant pipeline."""
-        # Get indexing pipeline stats
-        indexing_factory = IndexingPipelinesFactory()
-        indexing_stats = indexing_factory.get_organization_stats()
-        
-        # Get query pipeline stats
-        query_factory = QueryPipelinesFactory()
-        query_stats = query_factory.get_organization_stats()
+        # Both stats calls may hit Qdrant; overlap them instead of serializing
+        indexing_stats, query_stats = await asyncio.gather(
+            asyncio.to_thread(self._indexing_factory.get_organization_stats),
+            asyncio.to_thread(self._query_factory.get_organization_stats)
+        )
         
         # Combine stats
         combined_stats = {
@@ -26,14 +32,13 @@ class OrganizationService:
             "query_pipeline_stats": query_stats
         }
         
-        return OrganizationStats(
+        return OrganizationStats.model_construct(
             factory_instance_id=str(IndexingPipelinesFactory.get_instance_id()),
             multi_tenant_stats=combined_stats
         )
     
     def create_collection(self, organization_id: str) -> CreateCollectionResponse:
         """Create a Qdrant collection for an organization."""
-        document_store_manager = DocumentStoreManager()
-        result = document_store_manager.create_collection(organization_id)
+        result = self._document_store_manager.create_collection(organization_id)
         
-        return CreateCollectionResponse(**result)
+        return CreateCollectionResponse.model_construct(**result)
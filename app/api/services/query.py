@@ -1,35 +1,74 @@
+import asyncio
+import os
+
 from app.pipelines.query import QueryPipelinesFactory
 from app.api.models.requests import QueryRequest
 from app.api.models.responses import QueryResponse
 
+_ERROR_PREFIX = "Error executing query: "
+
 
 class QueryService:
     """Service layer for query operations with multi-tenant support."""
-    
+
+    __slots__ = ("query_factory", "_semaphore")
+
     def __init__(self):
         # Use the singleton factory for managing query pipelines
         self.query_factory = QueryPipelinesFactory()
-    
-    def execute_query(self, request_data: QueryRequest, organization_id: str = None, user_id: str = None) -> QueryResponse:
+        # Cap concurrent pipeline runs (LLM/Qdrant calls); excess requests
+        # queue on the semaphore instead of thrashing the threadpool
+        self._semaphore = asyncio.Semaphore(int(os.getenv("RETINA_QUERY_CONCURRENCY", "4")))
+
+    async def execute_query(self, request_data: QueryRequest, organization_id: str = None, user_id: str = None) -> QueryResponse:
         """Execute a query against specified targets with proper multi-tenant isolation."""
         try:
             # Determine which pipeline to use based on targets
             targets = request_data.targets
             pipeline = self.query_factory.get_organization_pipeline(organization_id)
+
+            async with self._semaphore:
+                # The async variant offloads each blocking section on its
+                # own and gathers the retrieval branches concurrently
+                answer = await pipeline.run_query_async(
+                    query=request_data.query,
+                    targets=targets,
+                    organization_id=organization_id,
+                    user_id=user_id
+                )
             
-            answer = pipeline.run_query(
-                query=request_data.query,
-                targets=targets,
-                organization_id=organization_id,
-                user_id=user_id
-            )
-            
-            return QueryResponse(
+            return QueryResponse.model_construct(
                 answer=answer,
                 sources=None  # TODO: Extract sources from pipeline result if available
             )
-        except Exception as e:
-            return QueryResponse(
-                answer=f"Error executing query: {str(e)}",
+        except ValueError as e:
+            # Domain errors raised by the pipeline (e.g. SQL safety
+            # validation); anything unexpected propagates to FastAPI's
+            # exception middleware as a 500 instead of being swallowed here
+            return QueryResponse.model_construct(
+                answer=_ERROR_PREFIX + str(e),
                 sources=None
             )
+
+    async def stream_query(self, request_data: QueryRequest, organization_id: str = None, user_id: str = None):
+        """Yield answer chunks as the pipeline produces them.
+
+        The pipeline's stream is a sync generator fed by a blocking LLM
+        call, so each chunk is pulled on a worker thread; the semaphore is
+        held for the whole stream since the pipeline stays busy throughout.
+        """
+        pipeline = self.query_factory.get_organization_pipeline(organization_id)
+        done = object()
+
+        async with self._semaphore:
+            chunks = pipeline.run_query_stream(
+                query=request_data.query,
+                targets=request_data.targets,
+                organization_id=organization_id,
+                user_id=user_id
+            )
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, done)
+                if chunk is done:
+                    break
+                yield chunk
@@ -2,52 +2,111 @@
 Configuration loader utility
 """
 
+import hashlib
 import os
+import pickle
 import sys
 import yaml
 import logging
 from typing import Dict, Any
 
+# Prefer the libyaml C loader; it is several times faster than the pure
+# Python parser and, unlike FullLoader, safe against arbitrary object
+# construction. Falls back to the Python SafeLoader when PyYAML was built
+# without libyaml.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ConfigLoader:
     """Configuration loader for YAML files"""
     
-    def __init__(self, config_path: str = "./config.yaml"):
+    def __init__(self, config_path: str = "./config.yaml", cache_dir: str = "./.cache"):
         self.config_path = config_path
+        self.cache_dir = cache_dir
         self._config = None
-    
+        self._flat = None
+
     def load(self) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file
+
+        Warm starts skip YAML parsing entirely: the parsed dict is pickled
+        next to the config keyed by (path, mtime, size), so unchanged
+        configs load with a single stat + pickle.load per process.
+        """
         if self._config is not None:
             return self._config
-            
+
         try:
+            cache_path = None
+            try:
+                stat = os.stat(self.config_path)
+                key = hashlib.blake2b(
+                    f"{self.config_path}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+                ).hexdigest()
+                cache_path = os.path.join(self.cache_dir, f"config_{key}.pkl")
+                with open(cache_path, "rb") as cache_file:
+                    self._config = pickle.load(cache_file)
+                self._build_flat_index()
+                return self._config
+            except (OSError, pickle.PickleError, EOFError):
+                pass  # No usable cache; fall through to the YAML parse
+
             with open(self.config_path, "r") as yaml_file:
-                self._config = yaml.load(yaml_file, Loader=yaml.FullLoader)
-            
+                self._config = yaml.load(yaml_file, Loader=_YamlLoader)
+
             if self._config is None:
                 raise Exception("empty data in configuration file")
-                
+
+            self._build_flat_index()
+
+            if cache_path is not None:
+                self._write_cache(cache_path)
+
             return self._config
-            
+
         except Exception as e:
             print(f"Error while loading {self.config_path}: {e}")
             sys.exit(101)
+
+    def _write_cache(self, cache_path: str) -> None:
+        """Best-effort atomic write of the parsed config cache."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as cache_file:
+                pickle.dump(self._config, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Caching is an optimization; never fail the load for it
     
+    def _build_flat_index(self) -> None:
+        """Flatten the nested config into a dotted-path -> value dict.
+
+        Built once per load so get() is a single dict lookup instead of a
+        split('.') plus chained subscripts per call. Dict subtrees are also
+        indexed under their parent key, so e.g. get('celery') still returns
+        the whole section.
+        """
+        flat: Dict[str, Any] = {}
+
+        def _walk(mapping: Dict[str, Any], prefix: str) -> None:
+            for key, value in mapping.items():
+                path = f"{prefix}.{key}" if prefix else key
+                flat[path] = value
+                if isinstance(value, dict):
+                    _walk(value, path)
+
+        _walk(self._config, "")
+        self._flat = flat
+
     def get(self, key_path: str, default=None):
         """Get configuration value using dot notation (e.g., 'redis.host')"""
-        if self._config is None:
+        if self._flat is None:
             self.load()
-            
-        keys = key_path.split('.')
-        value = self._config
-        
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key_path, default)
     
     def get_redis_url(self) -> str:
         """Get Redis URL from config"""
@@ -67,6 +126,41 @@ class ConfigLoader:
         return self.get('api', {})
 
 
+class _LazyConfiguration:
+    """Read-only mapping proxy that defers the config file read.
+
+    Importing this module no longer opens config.yaml; the file is parsed
+    on the first real access (ConfigLoader.load caches the dict, so every
+    access after that is just an attribute hop).
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return config_loader.load()[key]
+
+    def get(self, key, default=None):
+        return config_loader.load().get(key, default)
+
+    def __contains__(self, key):
+        return key in config_loader.load()
+
+    def __iter__(self):
+        return iter(config_loader.load())
+
+    def __len__(self):
+        return len(config_loader.load())
+
+    def keys(self):
+        return config_loader.load().keys()
+
+    def values(self):
+        return config_loader.load().values()
+
+    def items(self):
+        return config_loader.load().items()
+
+
 # Global configuration instance
 config_loader = ConfigLoader()
-configuration = config_loader.load()
+configuration = _LazyConfiguration()
@@ -1,10 +1,23 @@
+import logging
+
 from .base import TaskDispatcher
-from app.workers.ingestion_tasks import index_document
+from app.workers.ingestion_tasks import index_document, index_documents_batch
+
+logger = logging.getLogger(__name__)
+
 
 class CeleryDispatcher(TaskDispatcher):
+    def __init__(self):
+        # Task registry: dispatch stays O(1) as tasks are added, instead of
+        # growing an if/elif chain
+        self._tasks = {
+            "index_document": index_document,
+            "index_documents_batch": index_documents_batch,
+        }
+
     def dispatch(self, task_name: str, payload: dict) -> None:
-        if task_name == "index_document":
-            print(f"Dispatching task: {task_name} with payload: {payload}")
-            index_document.delay(payload)
-        else:
+        task = self._tasks.get(task_name)
+        if task is None:
             raise ValueError(f"Unknown task: {task_name}")
+        logger.debug("Dispatching task: %s", task_name)
+        task.delay(payload)
@@ -0,0 +1,100 @@
+"""
+Micro-batching embedding service for the query path.
+
+Each run_query call embeds a single query; under concurrent load the encoder
+would run once per request, serially. The batcher aggregates queries that
+arrive within a small window into one forward pass and demultiplexes the
+results, which is the dynamic-batching pattern embedding servers use. Query
+handlers run on worker threads (asyncio.to_thread), so the service is
+thread-based: callers block on a Future while a single worker thread owns
+the encoder.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List
+
+# One batcher per embedder instance; with a process-shared embedder all
+# tenants converge on a single batcher (and a single encoder queue)
+_batchers: dict = {}
+_batchers_lock = threading.Lock()
+
+
+def get_embedding_batcher(embedder, max_batch_size: int = 32, max_wait_ms: int = 8):
+    """Get or create the batcher bound to an embedder instance."""
+    key = id(embedder)
+    batcher = _batchers.get(key)
+    if batcher is None:
+        with _batchers_lock:
+            batcher = _batchers.get(key)
+            if batcher is None:
+                batcher = EmbeddingBatcher(
+                    embedder, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms
+                )
+                _batchers[key] = batcher
+    return batcher
+
+
+class EmbeddingBatcher:
+    """Aggregates concurrent single-query embeds into batched forward passes."""
+
+    def __init__(self, embedder, max_batch_size: int = 32, max_wait_ms: int = 8):
+        """
+        Start the batching worker around an embedder component.
+
+        Args:
+            embedder: Text embedder component (run(text=...) or embed_batch(texts))
+            max_batch_size: Queries embedded in one forward pass at most
+            max_wait_ms: How long the first query of a batch waits for company;
+                bounds the latency cost a lone query pays for batching
+        """
+        self.embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._worker, name="embedding-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def embed(self, text: str) -> List[float]:
+        """Embed one query, transparently batched with concurrent callers."""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    def _worker(self) -> None:
+        while True:
+            # Block for the first request, then linger briefly for more
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                embeddings = self._embed_batch(texts)
+                for (_, future), embedding in zip(batch, embeddings):
+                    future.set_result(embedding)
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Run one forward pass over the batch, whatever the embedder offers."""
+        embed_batch = getattr(self.embedder, "embed_batch", None)
+        if embed_batch is not None:
+            return embed_batch(texts)
+        # SentenceTransformersTextEmbedder exposes its batch-capable backend
+        # after warm_up; fall back to per-text runs if neither is available
+        backend = getattr(self.embedder, "embedding_backend", None)
+        if backend is not None:
+            return backend.embed(texts)
+        return [self.embedder.run(text=text)["embedding"] for text in texts]
@@ -2,6 +2,19 @@
 Haystack custom components for the query pipeline.
 """
 
+from .cleaning import FastCleaner
+from .converters import Pdfium2Converter
+from .embedding import CachedDocumentEmbedder, OptimumDocumentEmbedder, OptimumTextEmbedder
+from .sorting import LengthSorter
 from .sql import SQLGenerator, SQLQuery
 
-__all__ = ["SQLGenerator", "SQLQuery"]
+__all__ = [
+    "CachedDocumentEmbedder",
+    "FastCleaner",
+    "LengthSorter",
+    "OptimumDocumentEmbedder",
+    "OptimumTextEmbedder",
+    "Pdfium2Converter",
+    "SQLGenerator",
+    "SQLQuery",
+]
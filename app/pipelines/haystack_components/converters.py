@@ -0,0 +1,50 @@
+import threading
+from typing import List
+
+from haystack import component
+from haystack.dataclasses import ByteStream, Document
+
+# PDFium is not thread-safe: pypdfium2 documents that the library must not
+# be entered concurrently, even on distinct documents. With the worker's
+# thread pool and the batch path's converter threads, unguarded calls can
+# corrupt state or segfault, so every pdfium call serializes on this lock.
+_pdfium_lock = threading.Lock()
+
+
+@component
+class Pdfium2Converter:
+    """
+    A PDF-to-text converter backed by PDFium (pypdfium2).
+
+    pypdf parses PDFs in pure Python and dominates conversion time for large
+    files; PDFium is Google's C++ engine and is typically 5-10x faster for
+    plain text extraction. PDFium itself is single-threaded territory
+    (guarded by a module lock), so the speedup comes from the faster
+    extractor, not from parallel parsing.
+    """
+
+    @component.output_types(documents=List[Document])
+    def run(self, sources: List):
+        """
+        Extract text from PDF sources (paths or ByteStreams).
+
+        Args:
+            sources: PDF file paths or ByteStream objects
+
+        Returns:
+            Dictionary containing one Document per source, pages joined by
+            form feeds (same shape as PyPDFToDocument)
+        """
+        import pypdfium2 as pdfium
+
+        documents = []
+        for source in sources:
+            raw = source.data if isinstance(source, ByteStream) else source
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(raw)
+                try:
+                    text = "\f".join(page.get_textpage().get_text_range() for page in pdf)
+                finally:
+                    pdf.close()
+            documents.append(Document(content=text))
+        return {"documents": documents}
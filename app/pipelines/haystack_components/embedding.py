@@ -0,0 +1,253 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import List
+
+import numpy as np
+
+from haystack import component
+from haystack.dataclasses import Document
+
+
+@component
+class CachedDocumentEmbedder:
+    """
+    A content-hash cache in front of a document embedder.
+
+    Chunks with identical content (boilerplate headers, footers, templates
+    repeated across documents) produce identical embeddings, so re-running
+    the model on them is wasted inference. Hits are served from a per-worker
+    LRU keyed by a content digest; only misses reach the wrapped embedder.
+    """
+
+    def __init__(self, embedder, cache_size: int = 10000):
+        """
+        Initialize the cache around an existing embedder component.
+
+        Args:
+            embedder: Embedder component whose run(documents=...) sets embeddings
+            cache_size: Maximum number of cached embeddings (LRU eviction)
+        """
+        self.embedder = embedder
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        # The embedder is shared across the worker's task threads; unlocked
+        # OrderedDict bookkeeping (move_to_end vs popitem) raises KeyError
+        # under concurrent runs once the cache is full
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """Delegate model loading to the wrapped embedder."""
+        if hasattr(self.embedder, "warm_up"):
+            self.embedder.warm_up()
+
+    @component.output_types(documents=List[Document])
+    def run(self, documents: List[Document]):
+        """
+        Attach cached embeddings and embed only the cache misses.
+
+        Args:
+            documents: Documents to embed
+
+        Returns:
+            Dictionary containing the documents with embeddings set
+        """
+        misses = []
+        with self._lock:
+            for index, doc in enumerate(documents):
+                key = hashlib.blake2b((doc.content or "").encode(), digest_size=16).digest()
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    doc.embedding = list(cached)
+                else:
+                    misses.append((key, index))
+
+        if misses:
+            # The model call runs outside the lock so cache hits on other
+            # threads aren't serialized behind inference
+            miss_docs = [documents[index] for _, index in misses]
+            embedded = self.embedder.run(documents=miss_docs)["documents"]
+            with self._lock:
+                for (key, index), emb_doc in zip(misses, embedded):
+                    documents[index] = emb_doc
+                    if emb_doc.embedding is not None:
+                        self._cache[key] = emb_doc.embedding
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return {"documents": documents}
+
+
+def _load_onnx_model(model: str, cache_dir: str, quantize: bool):
+    """Load (exporting and caching on first use) an ONNX feature-extraction model.
+
+    Returns an (ORT model, tokenizer) pair. Shared by the document and text
+    embedders so both hit the same on-disk export cache.
+    """
+    # Imported lazily: optimum/onnxruntime are only required when the
+    # onnx backend is actually enabled in config
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    suffix = "--int8" if quantize else ""
+    model_dir = os.path.join(cache_dir, model.replace("/", "--") + suffix)
+    if not os.path.isdir(model_dir):
+        _export_onnx_model(model, model_dir, quantize)
+
+    file_name = "model_quantized.onnx" if quantize else None
+    ort_model = ORTModelForFeatureExtraction.from_pretrained(
+        model_dir, provider="CPUExecutionProvider", file_name=file_name
+    )
+    return ort_model, AutoTokenizer.from_pretrained(model_dir)
+
+
+def _export_onnx_model(model: str, model_dir: str, quantize: bool) -> None:
+    """Export (and optionally int8-quantize) the model into model_dir."""
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    exported = ORTModelForFeatureExtraction.from_pretrained(
+        model, export=True, provider="CPUExecutionProvider"
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model)
+    if quantize:
+        from optimum.onnxruntime import ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+        ORTQuantizer.from_pretrained(exported).quantize(
+            save_dir=model_dir, quantization_config=qconfig
+        )
+    else:
+        exported.save_pretrained(model_dir)
+    tokenizer.save_pretrained(model_dir)
+
+
+@component
+class OptimumDocumentEmbedder:
+    """
+    A Haystack component that embeds documents with an ONNX-Runtime model.
+
+    Exporting the sentence-transformers model through Optimum applies graph
+    fusion and oneDNN kernels, which typically reaches 2-2.5x the CPU
+    throughput of the eager PyTorch embedder for the same weights. The
+    exported model is cached on disk so Celery workers don't re-export at
+    every startup. Enabled via haystack.embedder.backend: "onnx" in config.
+    """
+
+    def __init__(self, model: str, cache_dir: str = "./.cache/onnx", batch_size: int = 32,
+                 quantize: bool = False):
+        """
+        Initialize the ONNX embedder, exporting the model on first use.
+
+        Args:
+            model: Hugging Face model name (e.g., "sentence-transformers/all-MiniLM-L6-v2")
+            cache_dir: Directory the exported ONNX model is cached in
+            batch_size: Documents embedded per forward pass
+            quantize: Apply dynamic int8 quantization to the exported model.
+                Shrinks weights ~4x and uses VNNI int8 dot-product kernels on
+                Cascade Lake+ CPUs, at the cost of slight embedding drift.
+        """
+        self.model, self.tokenizer = _load_onnx_model(model, cache_dir, quantize)
+        self.batch_size = batch_size
+
+    def _forward_pool(self, batch: dict) -> np.ndarray:
+        """Run the model on tokenized inputs, mean-pool and L2-normalize."""
+        hidden = np.ascontiguousarray(self.model(**batch).last_hidden_state)
+        mask = batch["attention_mask"].astype(hidden.dtype)
+        # einsum fuses masking and summation into one BLAS pass instead of
+        # materializing the full (batch, tokens, dim) masked intermediate
+        summed = np.einsum("btd,bt->bd", hidden, mask)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)[:, None]
+        embeddings = summed / counts
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.clip(norms, 1e-12, None)
+
+    @component.output_types(documents=List[Document])
+    def run(self, documents: List[Document]):
+        """
+        Embed documents in batches and attach vectors in place.
+
+        Args:
+            documents: Documents to embed
+
+        Returns:
+            Dictionary containing the documents with embeddings set
+        """
+        if not documents:
+            return {"documents": documents}
+
+        # One tokenizer call for the whole set: HF tokenizers carry a fixed
+        # per-call setup cost (Rust FFI, config lookup) that dominates when
+        # invoked once per mini-batch
+        texts = [doc.content or "" for doc in documents]
+        encoded = dict(self.tokenizer(texts, padding=True, truncation=True, return_tensors="np"))
+
+        for start in range(0, len(documents), self.batch_size):
+            batch = {k: v[start:start + self.batch_size] for k, v in encoded.items()}
+            # Re-trim to this batch's longest sequence so the upstream
+            # length sort keeps its padding savings (padding is right-side)
+            max_len = max(int(batch["attention_mask"].sum(axis=1).max()), 1)
+            batch = {k: v[:, :max_len] for k, v in batch.items()}
+            embeddings = self._forward_pool(batch)
+            for doc, embedding in zip(documents[start:start + self.batch_size], embeddings):
+                doc.embedding = embedding.tolist()
+        return {"documents": documents}
+
+
+@component
+class OptimumTextEmbedder:
+    """
+    A Haystack component that embeds a single query text with an ONNX model.
+
+    Query-side counterpart to OptimumDocumentEmbedder: same exported (and
+    optionally int8-quantized) model from the same on-disk cache, so the
+    query and document vectors live in the same space. The per-query
+    forward pass is where embedding latency goes, and the ORT graph-fused
+    (or VNNI int8) kernels cut it versus the eager fp32 PyTorch path.
+    Enabled via haystack.embedder.backend: "onnx" in config.
+    """
+
+    def __init__(self, model: str, cache_dir: str = "./.cache/onnx", quantize: bool = False,
+                 max_length: int = 128):
+        """
+        Initialize the ONNX text embedder, exporting the model on first use.
+
+        Args:
+            model: Hugging Face model name (e.g., "sentence-transformers/all-MiniLM-L6-v2")
+            cache_dir: Directory the exported ONNX model is cached in
+            quantize: Apply dynamic int8 quantization to the exported model
+            max_length: Token cap per query; queries are short, so a tight
+                cap avoids paying encoder time for padding
+        """
+        self.model, self.tokenizer = _load_onnx_model(model, cache_dir, quantize)
+        self.max_length = max_length
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts in one forward pass (micro-batching hook)."""
+        batch = dict(self.tokenizer(
+            texts, padding=True, truncation=True, max_length=self.max_length,
+            return_tensors="np"
+        ))
+        hidden = np.ascontiguousarray(self.model(**batch).last_hidden_state)
+        mask = batch["attention_mask"].astype(hidden.dtype)
+        summed = np.einsum("btd,bt->bd", hidden, mask)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)[:, None]
+        embeddings = summed / counts
+        embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return [embedding.astype(np.float32).tolist() for embedding in embeddings]
+
+    @component.output_types(embedding=List[float])
+    def run(self, text: str):
+        """
+        Embed one query text.
+
+        Args:
+            text: Query text to embed
+
+        Returns:
+            Dictionary containing the embedding vector
+        """
+        return {"embedding": self.embed_batch([text])[0]}
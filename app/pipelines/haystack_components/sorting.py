@@ -0,0 +1,31 @@
+from typing import List
+
+from haystack import component
+from haystack.dataclasses import Document
+
+
+@component
+class LengthSorter:
+    """
+    A Haystack component that orders documents by content length (descending).
+
+    The sentence-transformers embedder pads each mini-batch to its longest
+    member, so arbitrary chunk order wastes compute on padding tokens.
+    Sorting by length first means every batch is padded to a similar length
+    ("smart batching"), which substantially raises embedding throughput.
+    """
+
+    @component.output_types(documents=List[Document])
+    def run(self, documents: List[Document]):
+        """
+        Sort documents by content length, longest first.
+
+        Args:
+            documents: Documents to reorder
+
+        Returns:
+            Dictionary containing the length-sorted documents
+        """
+        return {
+            "documents": sorted(documents, key=lambda d: len(d.content or ""), reverse=True)
+        }
@@ -1,10 +1,94 @@
+import asyncio
+import csv
+import io
 import re
 import sqlite3
+import threading
 from typing import List, Set
+
+import sqlparse
+from sqlparse import tokens as sql_tokens
 from haystack import component
 from haystack.dataclasses import Document
 from haystack_integrations.components.generators.ollama import OllamaGenerator
 
+# Patterns used by the safety checks, compiled once at import. These run on
+# every generated and executed SQL query, so per-call re.* string-pattern
+# lookups add up.
+_SINGLE_QUOTED_RE = re.compile(r"'[^']*'")
+_DOUBLE_QUOTED_RE = re.compile(r'"[^"]*"')
+
+_QUOTE_INJECTION_RES: List[re.Pattern] = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r"'\s*OR\s*'",  # ' OR ' (string concatenation)
+        r"'\s*AND\s*'",  # ' AND ' (string concatenation)
+        r"'\s*OR\s+1\s*=\s*1",  # ' OR 1=1
+        r"'\s*OR\s+TRUE",  # ' OR TRUE
+        r"'\s*OR\s+'[^']*'\s*=\s*'[^']*'",  # ' OR 'a'='a'
+        r"'\s*UNION\s+(ALL\s+)?SELECT",  # ' UNION (ALL) SELECT - string break injection
+        # Semicolon injection patterns
+        r"';\s*DROP",  # '; DROP
+        r"';\s*DELETE",  # '; DELETE
+        r"';\s*UPDATE",  # '; UPDATE
+        r"';\s*INSERT",  # '; INSERT
+    )
+]
+
+_NON_QUOTE_INJECTION_RES: List[re.Pattern] = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r"0\s*=\s*0",  # 0=0 (always true)
+        r"NULL\s*IS\s*NULL",  # NULL IS NULL (always true)
+        r"[;]\s*UNION\s+(ALL\s+)?SELECT",  # ; UNION (ALL) SELECT - semicolon separated injection
+    )
+]
+
+# Detects an existing LIMIT clause before SQLQuery appends its own row cap
+_LIMIT_RE = re.compile(r"\bLIMIT\s+\d+", re.IGNORECASE)
+
+# SQL-extraction regexes for SQLGenerator, compiled once at import
+_SQL_FENCE_RE = re.compile(r"```sql\s+(.*?)```", re.S | re.I)
+_LEAD_RE = re.compile(r'^.*?(?=SELECT|WITH|SHOW|DESCRIBE|DESC|EXPLAIN|PRAGMA)', re.I | re.S)
+_TAIL_RE = re.compile(r';.*$', re.S)  # Remove text after semicolon
+
+# Generation prompt pieces; the schema-bearing prefix is bound once per
+# SQLGenerator in __init__, so each call only concatenates the question
+_PROMPT_PREFIX_TMPL = (
+    "You are a SQL expert. "
+    "Given the following database schema, generate ONE valid SQL query "
+    "to answer the user's question.\n\n"
+    "IMPORTANT SAFETY RULES:\n"
+    "- ONLY generate SELECT, WITH, SHOW, DESCRIBE, DESC, EXPLAIN, or PRAGMA statements\n"
+    "- NEVER generate INSERT, UPDATE, DELETE, DROP, CREATE, ALTER, TRUNCATE, or any data modification queries\n"
+    "- Focus on data retrieval and analysis only\n"
+    "- Do not include comments or multiple statements\n\n"
+    "Schema:\n{schema}\n\n"
+    "Question: "
+)
+_PROMPT_SUFFIX = "\n\nReturn only the SQL inside ```sql ... ```."
+
+# Lexical signals that a question wants tabular/aggregate data. The NL->SQL
+# LLM call is the slowest step in the SQL branch; questions that match none
+# of these and mention nothing from the schema skip it entirely.
+_SQL_INTENT_TERMS = (
+    "how many", "how much", "count", "number of", "average", "avg", "sum",
+    "total", "minimum", "maximum", "highest", "lowest", "most", "least",
+    "fewest", "list all", "show all", "top ", "latest", "newest", "oldest",
+    "earliest", "recent", "per ", "each", "between", "greater than",
+    "less than", "more than", "at least", "at most", "group", "sort",
+    "order", "rows", "records", "entries", "table",
+)
+
+# Identifier-ish words; used both to harvest schema names and to tokenize
+# incoming questions for schema mentions
+_IDENT_RE = re.compile(r"[a-z_][a-z0-9_]{2,}")
+
+# SQL/DDL vocabulary filtered out when harvesting identifiers from a schema
+_SCHEMA_NOISE = frozenset({
+    "create", "table", "integer", "text", "primary", "key", "not", "null",
+    "default", "datetime", "decimal", "date", "boolean", "varchar", "unique",
+    "foreign", "references", "current_timestamp", "autoincrement",
+})
+
 
 class SQLSafetyValidator:
     """
@@ -14,7 +98,8 @@ class SQLSafetyValidator:
     SQL queries before execution, preventing data modification or schema changes.
     """
     
-    def __init__(self, llm_model: str = None, llm_base_url: str = None):
+    def __init__(self, llm_model: str = None, llm_base_url: str = None,
+                 enable_llm_safety: bool = False, llm: OllamaGenerator = None):
         # Allowed SQL operations (whitelist approach for quick checks)
         self.allowed_operations: Set[str] = {
             "SELECT", "WITH", "SHOW", "DESCRIBE", "DESC", "EXPLAIN", "PRAGMA"
@@ -22,26 +107,28 @@ class SQLSafetyValidator:
         
         # Dangerous SQL keywords (blacklist approach for quick checks)
         self.dangerous_keywords: Set[str] = {
-            "DROP", "DELETE", "UPDATE", "INSERT", "TRUNCATE", "ALTER", 
+            "DROP", "DELETE", "UPDATE", "INSERT", "TRUNCATE", "ALTER",
             "CREATE", "REPLACE", "MERGE", "UPSERT", "ATTACH", "DETACH",
-            "VACUUM", "REINDEX", "ANALYZE"
+            "VACUUM", "REINDEX", "ANALYZE", "EXEC", "EXECUTE"
         }
         
-        # Initialize LLM for advanced safety checking if provided
-        self.use_llm = llm_model and llm_base_url
-        if self.use_llm:
-            self.llm = OllamaGenerator(model=llm_model, url=llm_base_url)
-        
-        # Additional dangerous patterns for rule-based checking
-        self.dangerous_patterns: List[str] = [
-            r";\s*(DROP|DELETE|UPDATE|INSERT|TRUNCATE|ALTER|CREATE)",  # Multiple statements
-            r"--.*?(DROP|DELETE|UPDATE|INSERT|TRUNCATE|ALTER|CREATE)",  # Commented dangerous ops
-            r"/\*.*?(DROP|DELETE|UPDATE|INSERT|TRUNCATE|ALTER|CREATE).*?\*/",  # Block commented ops
-            r"EXEC\s*\(",  # Stored procedure execution
-            r"EXECUTE\s*\(",  # Execute statements
-            r"xp_",  # Extended stored procedures (SQL Server)
-            r"sp_",  # System stored procedures
-        ]
+        # LLM-based checking is opt-in: it adds a full Ollama round-trip to
+        # every query, which roughly doubles end-to-end latency. Callers that
+        # already hold a generator for the same endpoint pass it in so both
+        # components share one HTTP client instead of opening a second pool.
+        if llm is None and enable_llm_safety and llm_model and llm_base_url:
+            llm = OllamaGenerator(model=llm_model, url=llm_base_url)
+        self.llm = llm
+        self.use_llm = enable_llm_safety and llm is not None
+        # Memoized LLM verdicts keyed by whitespace-normalized query text
+        self._llm_cache: dict = {}
+
+        # One alternation finds any dangerous keyword in a single scan
+        # instead of one regex engine entry per keyword
+        self._dangerous_keyword_re = re.compile(
+            r'\b(' + '|'.join(re.escape(k) for k in sorted(self.dangerous_keywords)) + r')\b',
+            re.IGNORECASE
+        )
     
     def is_safe_query(self, query: str) -> tuple[bool, str]:
         """
@@ -55,51 +142,91 @@ class SQLSafetyValidator:
         """
         if not query or not query.strip():
             return False, "Empty query provided"
-        
+
+        # Fast path: reject on the first word alone before paying for
+        # tokenization. Only plain-word leads are decided here; queries
+        # starting with comments or parentheses fall through to the full
+        # check, which handles them structurally.
+        first_word = query.split(None, 1)[0].rstrip(';').upper()
+        if first_word.isalpha() and first_word not in self.allowed_operations:
+            return False, f"Query must start with allowed operations: {', '.join(self.allowed_operations)}. Found: {first_word}"
+
         # First, do quick rule-based checks for obvious violations
         rule_based_result = self._rule_based_safety_check(query)
         if not rule_based_result[0]:
             return rule_based_result
         
         if self.use_llm:
-            llm_result = self._llm_based_safety_check(query)
+            # Re-queries of semantically identical SQL reuse the cached verdict
+            cache_key = ' '.join(query.split())
+            llm_result = self._llm_cache.get(cache_key)
+            if llm_result is None:
+                llm_result = self._llm_based_safety_check(query)
+                if len(self._llm_cache) >= 2048:
+                    self._llm_cache.clear()
+                self._llm_cache[cache_key] = llm_result
             if not llm_result[0]:
                 return llm_result
-        
+
         return True, "Query passed both rule-based and LLM safety checks"
 
     def _rule_based_safety_check(self, query: str) -> tuple[bool, str]:
         """
-        Perform rule-based safety validation using patterns and keywords.
-        
+        Perform rule-based safety validation with one sqlparse tokenization pass.
+
+        The lexer classifies string literals, comments and keywords for us,
+        so dangerous keywords inside quoted values need no regex stripping
+        and multiple statements are detected structurally.
+
         Args:
             query: SQL query string to validate
-            
+
         Returns:
             Tuple of (is_safe: bool, reason: str)
         """
-        # Normalize query for analysis
-        normalized_query = query.upper().strip()
-        normalized_query = re.sub(r'\s+', ' ', normalized_query)
-        
-        # Check if query starts with allowed operations
-        first_word = normalized_query.split()[0] if normalized_query.split() else ""
-        if first_word not in self.allowed_operations:
-            return False, f"Query must start with allowed operations: {', '.join(self.allowed_operations)}. Found: {first_word}"
-        
-        # Check for dangerous keywords (but be smart about string literals)
-        if self._has_dangerous_keywords_in_context(normalized_query):
-            return False, "Dangerous keyword detected in executable context"
-        
-        # Check for dangerous patterns using regex
-        for pattern in self.dangerous_patterns:
-            if re.search(pattern, normalized_query, re.IGNORECASE | re.DOTALL):
-                return False, f"Dangerous pattern detected matching: {pattern}"
-        
+        statements = [
+            statement for statement in sqlparse.parse(query)
+            if statement.token_first(skip_cm=True) is not None
+        ]
+        if not statements:
+            return False, "Empty query provided"
+        if len(statements) > 1:
+            return False, "Multiple SQL statements are not allowed"
+
+        first_word = ""
+        for token in statements[0].flatten():
+            ttype = token.ttype
+            if ttype in sql_tokens.Whitespace:
+                continue
+            if ttype in sql_tokens.Comment:
+                # Dangerous operations hidden in comments are still rejected
+                if self._dangerous_keyword_re.search(token.value):
+                    return False, "Dangerous keyword detected in comment"
+                continue
+            if ttype in sql_tokens.Literal.String or ttype in sql_tokens.String:
+                continue
+            value_upper = token.value.upper()
+            if not first_word:
+                # Covers Name tokens too: sqlparse lexes e.g. PRAGMA as Name
+                first_word = value_upper
+                if first_word not in self.allowed_operations:
+                    return False, f"Query must start with allowed operations: {', '.join(self.allowed_operations)}. Found: {first_word}"
+                continue
+            if ttype in sql_tokens.Name:
+                # Extended/system stored procedures (SQL Server style)
+                if value_upper.startswith(("XP_", "SP_")):
+                    return False, "Stored procedure call detected"
+                continue
+            if value_upper in self.dangerous_keywords:
+                return False, "Dangerous keyword detected in executable context"
+
+        if not first_word:
+            return False, "Empty query provided"
+
         # Additional checks for SQL injection attempts
-        if self._check_sql_injection_patterns(normalized_query):
+        if self._check_sql_injection_patterns(query):
             return False, "Potential SQL injection pattern detected"
-        
+
         return True, "Query passed rule-based safety checks"
     
     def _llm_based_safety_check(self, query: str) -> tuple[bool, str]:
@@ -157,68 +284,23 @@ class SQLSafetyValidator:
             # If LLM fails, fall back to rule-based validation
             return self._rule_based_safety_check(query)
     
-    def _has_dangerous_keywords_in_context(self, query: str) -> bool:
-        """
-        Check for dangerous keywords but ignore them when they appear in string literals.
-        
-        Args:
-            query: Normalized SQL query string
-            
-        Returns:
-            True if dangerous keywords are found in executable context
-        """
-        # Remove string literals to avoid false positives
-        # Handle both single and double quotes
-        query_without_strings = re.sub(r"'[^']*'", " 'STRING' ", query)
-        query_without_strings = re.sub(r'"[^"]*"', ' "STRING" ', query_without_strings)
-        
-        # Check for dangerous keywords in the cleaned query
-        # Use word boundaries to avoid partial matches
-        for keyword in self.dangerous_keywords:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, query_without_strings, re.IGNORECASE):
-                return True
-        return False
-    
     def _check_sql_injection_patterns(self, query: str) -> bool:
         """Check for common SQL injection patterns."""
-        
-        # Patterns that work on the original query (looking for quote patterns)
-        quote_based_patterns = [
-            r"'\s*OR\s*'",  # ' OR ' (string concatenation)
-            r"'\s*AND\s*'",  # ' AND ' (string concatenation)  
-            r"'\s*OR\s+1\s*=\s*1",  # ' OR 1=1
-            r"'\s*OR\s+TRUE",  # ' OR TRUE  
-            r"'\s*OR\s+'[^']*'\s*=\s*'[^']*'",  # ' OR 'a'='a'
-            r"'\s*UNION\s+(ALL\s+)?SELECT",  # ' UNION (ALL) SELECT - string break injection
-            # Semicolon injection patterns
-            r"';\s*DROP",  # '; DROP
-            r"';\s*DELETE",  # '; DELETE
-            r"';\s*UPDATE",  # '; UPDATE
-            r"';\s*INSERT",  # '; INSERT
-        ]
-        
+
         # Check quote-based patterns on original query
-        for pattern in quote_based_patterns:
-            if re.search(pattern, query, re.IGNORECASE):
+        for pattern in _QUOTE_INJECTION_RES:
+            if pattern.search(query):
                 return True
-        
+
         # Remove string literals for other patterns
-        query_without_strings = re.sub(r"'[^']*'", " 'STRING' ", query)
-        query_without_strings = re.sub(r'"[^"]*"', ' "STRING" ', query_without_strings)
-        
-        # Patterns that work on query without string literals
-        non_quote_patterns = [
-            r"0\s*=\s*0",  # 0=0 (always true)
-            r"NULL\s*IS\s*NULL",  # NULL IS NULL (always true)
-            r"[;]\s*UNION\s+(ALL\s+)?SELECT",  # ; UNION (ALL) SELECT - semicolon separated injection
-        ]
-        
+        query_without_strings = _SINGLE_QUOTED_RE.sub(" 'STRING' ", query)
+        query_without_strings = _DOUBLE_QUOTED_RE.sub(' "STRING" ', query_without_strings)
+
         # Check non-quote patterns on cleaned query
-        for pattern in non_quote_patterns:
-            if re.search(pattern, query_without_strings, re.IGNORECASE):
+        for pattern in _NON_QUOTE_INJECTION_RES:
+            if pattern.search(query_without_strings):
                 return True
-                
+
         return False
 
 
@@ -232,51 +314,122 @@ class SQLGenerator:
     Includes safety validation to prevent destructive operations.
     """
 
-    def __init__(self, model: str, base_url: str, schema: str = ""):
+    def __init__(self, model: str, base_url: str, schema: str = "", enable_llm_safety: bool = False,
+                 generation_kwargs: dict = None, keep_alive: str = None,
+                 llm: OllamaGenerator = None, enable_intent_filter: bool = True):
         """
         Initialize the SQL generator.
-        
+
         Args:
             model: Ollama model name (e.g., "llama3.2", "mistral")
             base_url: Ollama server URL (e.g., "http://localhost:11434")
             schema: Database schema description for SQL generation
+            enable_llm_safety: Opt into the extra LLM safety round-trip
+            generation_kwargs: Ollama options (num_predict, num_ctx, ...) to
+                bound decode cost for the NL->SQL call
+            keep_alive: How long Ollama keeps the model loaded between calls
+            llm: Already-constructed generator to share (its own settings
+                win over model/base_url/generation_kwargs/keep_alive)
+            enable_intent_filter: Skip the LLM call for questions with no
+                lexical SQL intent and no schema mention (sub-millisecond
+                check versus a full generation round-trip)
         """
-        self.llm = OllamaGenerator(model=model, url=base_url)
+        if llm is None:
+            llm = OllamaGenerator(
+                model=model, url=base_url,
+                generation_kwargs=generation_kwargs, keep_alive=keep_alive
+            )
+        self.llm = llm
         self.schema = schema
-        # Initialize safety validator with LLM for advanced safety checking
-        self.safety_validator = SQLSafetyValidator(llm_model=model, llm_base_url=base_url)
+        # Everything that depends only on the schema is rendered once here
+        self._prompt_prefix = _PROMPT_PREFIX_TMPL.format(schema=schema)
+        self.enable_intent_filter = enable_intent_filter
+        # Table/column names harvested once; a question mentioning any of
+        # them counts as SQL intent even without aggregate phrasing
+        self._schema_identifiers = frozenset(
+            ident for ident in _IDENT_RE.findall(schema.lower())
+            if ident not in _SCHEMA_NOISE
+        )
+        # Rule-based validation only by default; the LLM check is opt-in.
+        # The validator reuses the generator's Ollama client rather than
+        # building a second one against the same endpoint.
+        self.safety_validator = SQLSafetyValidator(
+            llm=self.llm, enable_llm_safety=enable_llm_safety
+        )
 
     @component.output_types(sql=str)
     def run(self, question: str) -> dict:
         """
         Generate SQL query from natural language question with safety validation.
-        
+
         Args:
             question: Natural language question to convert to SQL
-            
+
         Returns:
             Dictionary containing the generated SQL query
-            
+
         Raises:
             ValueError: If the generated query is deemed unsafe
         """
-        prompt = (
-            "You are a SQL expert. "
-            "Given the following database schema, generate ONE valid SQL query "
-            "to answer the user's question.\n\n"
-            "IMPORTANT SAFETY RULES:\n"
-            "- ONLY generate SELECT, WITH, SHOW, DESCRIBE, DESC, EXPLAIN, or PRAGMA statements\n"
-            "- NEVER generate INSERT, UPDATE, DELETE, DROP, CREATE, ALTER, TRUNCATE, or any data modification queries\n"
-            "- Focus on data retrieval and analysis only\n"
-            "- Do not include comments or multiple statements\n\n"
-            f"Schema:\n{self.schema}\n\n"
-            f"Question: {question}\n\n"
-            "Return only the SQL inside ```sql ... ```."
-        )
+        return {"sql": self._generate_sql(question)}
+
+    async def run_batch(self, questions: List[str]) -> List[str]:
+        """
+        Generate SQL for several questions concurrently.
+
+        The Ollama client is blocking, so each generation runs in a worker
+        thread and ``asyncio.gather`` overlaps the network/model latency:
+        N queued questions cost roughly one round-trip of wall clock instead
+        of N sequential ones. Safety validation runs per question exactly as
+        in :meth:`run` (rule-based first, then the optional LLM check).
+
+        Args:
+            questions: Natural language questions to convert to SQL
+
+        Returns:
+            Generated SQL queries, in the same order as the questions
+
+        Raises:
+            ValueError: If any generated query is deemed unsafe
+        """
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self._generate_sql, question) for question in questions)
+        ))
+
+    def _has_sql_intent(self, question: str) -> bool:
+        """Cheap lexical check for whether a question plausibly wants SQL.
+
+        True when the question uses aggregate/tabular phrasing or mentions a
+        schema identifier (singular/plural tolerant). Deliberately generous:
+        a false positive costs one LLM call, a false negative loses the SQL
+        context for that answer.
+        """
+        lowered = question.lower()
+        if any(term in lowered for term in _SQL_INTENT_TERMS):
+            return True
+        for word in _IDENT_RE.findall(lowered):
+            if (word in self._schema_identifiers
+                    or word + "s" in self._schema_identifiers
+                    or word.rstrip("s") in self._schema_identifiers):
+                return True
+        return False
+
+    def _generate_sql(self, question: str) -> str:
+        """Run one generation round-trip and validate the extracted SQL."""
+        # Questions with no detectable SQL intent skip the generation
+        # entirely and contribute no SQL context
+        if self.enable_intent_filter and not self._has_sql_intent(question):
+            return ""
+
+        prompt = self._prompt_prefix + question + _PROMPT_SUFFIX
         reply = self.llm.run(prompt=prompt)["replies"][0]
 
-        # Extract SQL from code fence or fallback to the entire reply if no fence
-        m = re.search(r"```sql\s+(.*?)```", reply, flags=re.S | re.I)
+        # Extract SQL from code fence or fallback to the entire reply if no
+        # fence. str.find decides fence presence and anchors the regex at the
+        # fence, so absent markers never enter the regex engine and present
+        # ones skip the leading prose
+        fence_start = reply.find("```sql")
+        m = _SQL_FENCE_RE.search(reply, fence_start) if fence_start != -1 else None
         if m:
             sql = m.group(1).strip()
         else:
@@ -284,16 +437,16 @@ class SQLGenerator:
             # Look for common SQL patterns and clean up the response
             sql = reply.strip()
             # Remove any leading/trailing text that's not SQL
-            sql = re.sub(r'^.*?(?=SELECT|WITH|SHOW|DESCRIBE|DESC|EXPLAIN|PRAGMA)', '', sql, flags=re.IGNORECASE | re.DOTALL)
-            sql = re.sub(r';.*$', ';', sql, flags=re.DOTALL)  # Remove text after semicolon
+            sql = _LEAD_RE.sub('', sql)
+            sql = _TAIL_RE.sub(';', sql)
             sql = sql.strip()
         
         # Validate the generated SQL for safety
         is_safe, reason = self.safety_validator.is_safe_query(sql)
         if not is_safe:
             raise ValueError(f"Generated SQL query failed safety validation: {reason}. Query: {sql}")
-        
-        return {"sql": sql}
+
+        return sql
 
 
 @component
@@ -306,18 +459,44 @@ class SQLQuery:
     Includes safety validation to prevent destructive operations.
     """
 
-    def __init__(self, conn_str: str, llm_model: str = None, llm_base_url: str = None):
+    def __init__(self, conn_str: str, llm_model: str = None, llm_base_url: str = None, enable_llm_safety: bool = False):
         """
         Initialize the SQL query executor.
-        
+
         Args:
             conn_str: SQLite database connection string/path
             llm_model: Optional LLM model for advanced safety checking
             llm_base_url: Optional LLM base URL for advanced safety checking
+            enable_llm_safety: Opt into the extra LLM safety round-trip
         """
         self.conn_str = conn_str
-        # Initialize safety validator with optional LLM for advanced safety checking
-        self.safety_validator = SQLSafetyValidator(llm_model=llm_model, llm_base_url=llm_base_url)
+        # Rule-based validation only by default; the LLM check is opt-in
+        self.safety_validator = SQLSafetyValidator(
+            llm_model=llm_model, llm_base_url=llm_base_url, enable_llm_safety=enable_llm_safety
+        )
+        # One persistent connection per thread; connect + pragma setup and a
+        # cold page cache per call dominate small reporting queries
+        self._local = threading.local()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get (or lazily open) this thread's persistent connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # mode=ro + query_only make SQLite itself enforce read-only:
+            # any write attempt raises OperationalError, which run() turns
+            # into the same ValueError the validator would produce
+            # cached_statements keeps compiled statements for repeated query
+            # shapes, sparing the SQL->VDBE compile on re-execution
+            conn = sqlite3.connect(
+                f"file:{self.conn_str}?mode=ro", uri=True, check_same_thread=False,
+                cached_statements=256
+            )
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA busy_timeout = 30000")  # 30 second timeout
+            conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB mmap window
+            conn.execute("PRAGMA temp_store = MEMORY")  # Sorts/temp b-trees stay off disk
+            self._local.conn = conn
+        return conn
 
     @component.output_types(documents=list[Document])
     def run(self, query: str):
@@ -338,22 +517,40 @@ class SQLQuery:
         if not is_safe:
             raise ValueError(f"SQL query failed safety validation: {reason}. Query: {query}")
         
+        max_rows = 1000
+
+        # Push the row cap into the SQL itself when the query has no LIMIT:
+        # SQLite's engine then halts the scan after max_rows + 1 rows rather
+        # than computing the full result set for the driver to abandon.
+        # Only SELECT/WITH accept LIMIT; other allowed statements pass as-is.
+        first_word = query.split(None, 1)[0].rstrip(';').upper() if query.split() else ""
+        if first_word in ("SELECT", "WITH") and _LIMIT_RE.search(query) is None:
+            query = f"{query.rstrip().rstrip(';')} LIMIT {max_rows + 1}"
+
         try:
-            with sqlite3.connect(self.conn_str) as conn:
-                # Set a timeout to prevent long-running queries
-                conn.execute("PRAGMA busy_timeout = 30000")  # 30 second timeout
-                
-                cur = conn.execute(query)
-                cols = [c[0] for c in cur.description] if cur.description else []
-                rows = cur.fetchall()
+            cur = self._get_connection().execute(query)
+            cols = [c[0] for c in cur.description] if cur.description else []
 
-            # Limit the number of rows returned to prevent memory issues
-            max_rows = 1000
-            if len(rows) > max_rows:
+            # Limit the number of rows returned to prevent memory issues.
+            # fetchmany stops the driver at the cap instead of materializing
+            # an arbitrarily large result set just to slice it; one extra
+            # row tells us whether the result was truncated.
+            rows = cur.fetchmany(max_rows + 1)
+            truncated = len(rows) > max_rows
+            if truncated:
                 rows = rows[:max_rows]
-                content = f"SQL Results (showing first {max_rows} of {len(rows)} rows):\nColumns: {cols}\nRows: {rows}"
+
+            # Render as CSV via the C-implemented csv module; repr() of a
+            # list of tuples builds one huge Python string element by element
+            # and dominated run() wall time on wide result sets
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(cols)
+            writer.writerows(rows)
+            if truncated:
+                content = f"SQL Results (showing first {max_rows} rows):\n" + buf.getvalue()
             else:
-                content = f"SQL Results:\nColumns: {cols}\nRows: {rows}"
+                content = "SQL Results:\n" + buf.getvalue()
                 
             return {"documents": [Document(content=content)]}
             
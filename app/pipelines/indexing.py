@@ -1,16 +1,21 @@
-import structlog
-import tempfile
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
+from pypdf import PdfReader
+
 from celery.utils.log import get_task_logger
-from app.storage.minio_client import download_file
+from app.storage.minio_client import download_file, stat_object_etag
 from app.config_loader import configuration
 
 # Haystack imports
-from haystack import Pipeline, Document
+from haystack import Document
+from haystack.dataclasses import ByteStream
 from haystack.components.converters import (
     PyPDFToDocument,
     TextFileToDocument
@@ -20,29 +25,100 @@ from haystack.components.embedders import SentenceTransformersDocumentEmbedder
 from haystack.components.writers import DocumentWriter
 from haystack.document_stores.types import DuplicatePolicy
 
+from app.pipelines.haystack_components import (
+    CachedDocumentEmbedder,
+    FastCleaner,
+    LengthSorter,
+    OptimumDocumentEmbedder,
+    Pdfium2Converter,
+)
 from app.storage.document_store_manager import DocumentStoreManager
 
+def _extract_pdf_page_range(data: bytes, start: int, end: int) -> str:
+    """Extract text from pages [start, end) of a PDF given as bytes.
+
+    Module-level so ProcessPoolExecutor workers can pickle it.
+    """
+    reader = PdfReader(io.BytesIO(data))
+    return "\f".join((page.extract_text() or "") for page in reader.pages[start:end])
+
+
 class DocumentType(Enum):
     """Supported document types with native Haystack converters"""
     PDF = "pdf"
     TXT = "txt"
 
+# File type mappings - simplified for PDF and TXT only
+_FILE_TYPE_MAP = {
+    '.pdf': DocumentType.PDF,
+    '.txt': DocumentType.TXT,
+}
+
+@lru_cache(maxsize=256)
+def _detect_file_type(object_path: str) -> DocumentType:
+    """Map an object path to its DocumentType, defaulting to TXT.
+
+    Memoized: detection runs at least twice per document (conversion and
+    result building) and each call allocates a Path just to read the suffix.
+    """
+    return _FILE_TYPE_MAP.get(Path(object_path).suffix.lower(), DocumentType.TXT)
+
 class HaystackNativeConverters:
     """Wrapper for native Haystack converters - simplified for PDF and TXT only"""
-    
+
+    # Page parsing is pure-Python CPU work gated by the GIL; below this page
+    # count the fork/pickle overhead of the pool outweighs the parallelism
+    _MIN_PARALLEL_PAGES = 8
+    _process_pool = None
+
     def __init__(self):
-        # Initialize only PDF and TXT converters
-        self.pdf_converter = PyPDFToDocument()
+        # Initialize only PDF and TXT converters. PDFium extracts text 5-10x
+        # faster than pypdf and releases the GIL; fall back to pypdf when
+        # pypdfium2 isn't installed.
+        try:
+            import pypdfium2  # noqa: F401
+            self.pdf_converter = Pdfium2Converter()
+            self._pdfium = True
+        except ImportError:
+            self.pdf_converter = PyPDFToDocument()
+            self._pdfium = False
         self.text_converter = TextFileToDocument()
-    
-    def convert_pdf(self, file_path: str) -> List[Document]:
-        """Convert PDF using PyPDFToDocument"""
-        result = self.pdf_converter.run(sources=[file_path])
-        return result["documents"]
-    
-    def convert_text(self, file_path: str) -> List[Document]:
-        """Convert text file using TextFileToDocument"""
-        result = self.text_converter.run(sources=[file_path])
+
+    @classmethod
+    def _get_process_pool(cls) -> ProcessPoolExecutor:
+        """Build the shared page-parsing pool once per process."""
+        if cls._process_pool is None:
+            cls._process_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return cls._process_pool
+
+    def convert_pdf(self, source) -> List[Document]:
+        """Convert PDF to text (path or ByteStream source)
+
+        With pypdfium2 installed, PDFium's C++ extractor handles the whole
+        document directly. On the pypdf fallback, large PDFs are split into
+        page ranges parsed in parallel worker processes, sidestepping the
+        GIL for the per-page text extraction that dominates wall time.
+        """
+        if self._pdfium:
+            return self.pdf_converter.run(sources=[source])["documents"]
+
+        data = source.data if isinstance(source, ByteStream) else Path(source).read_bytes()
+        page_count = len(PdfReader(io.BytesIO(data)).pages)
+        if page_count < self._MIN_PARALLEL_PAGES:
+            return self.pdf_converter.run(sources=[source])["documents"]
+
+        workers = min(os.cpu_count() or 1, page_count)
+        bounds = [round(i * page_count / workers) for i in range(workers + 1)]
+        starts, ends = bounds[:-1], bounds[1:]
+        texts = self._get_process_pool().map(
+            _extract_pdf_page_range, repeat(data), starts, ends
+        )
+        # Same shape as PyPDFToDocument: one Document, pages joined by \f
+        return [Document(content="\f".join(texts))]
+
+    def convert_text(self, source) -> List[Document]:
+        """Convert text using TextFileToDocument (path or ByteStream source)"""
+        result = self.text_converter.run(sources=[source])
         return result["documents"]
 
 
@@ -64,22 +140,16 @@ class IndexingPipelinesFactory:
     def __init__(self):
         # Only initialize once, even if __init__ is called multiple times
         if not self._initialized:
-            #self.logger = structlog.get_logger()
             self.logger = get_task_logger(__name__)
             self.logger.info("[Haystack Factory] Initializing Multi-tenant Pipelines Factory")
             
-            # Multi-tenant storage: collections per organization
-            self._document_stores = {}  # org_id -> QdrantDocumentStore
-            self._processing_pipelines = {}  # org_id -> Pipeline
+            # Multi-tenant storage: stores live in DocumentStoreManager,
+            # this factory only keeps the per-org writers
+            self._components = None  # shared (cleaner, splitter, sorter, embedder)
+            self._writers = {}  # org_id -> (document store, DocumentWriter)
             
             self.converters = HaystackNativeConverters()
-            
-            # File type mappings - simplified for PDF and TXT only
-            self.file_type_map = {
-                '.pdf': DocumentType.PDF,
-                '.txt': DocumentType.TXT,
-            }
-            
+
             # Mark as initialized to prevent re-initialization
             IndexingPipelinesFactory._initialized = True
         else:
@@ -88,21 +158,10 @@ class IndexingPipelinesFactory:
     
     def get_document_store(self, organization_id: str):
         """Get or create document store for a specific organization"""
-        # Delegate to the shared DocumentStoreManager for consistency
-        store_manager = DocumentStoreManager()
-        
-        self.logger.info(f"[Haystack Factory] Getting document store for org: {organization_id}")
-        return store_manager.get_document_store(organization_id)
-    
-    def get_processing_pipeline(self, organization_id: str):
-        """Get or create processing pipeline for a specific organization"""
-        if organization_id not in self._processing_pipelines:
-            self.logger.info(f"[Haystack Factory] Creating processing pipeline for org: {organization_id}")
-            document_store = self.get_document_store(organization_id)
-            self._processing_pipelines[organization_id] = self.create_processing_pipeline(document_store)
-        else:
-            self.logger.info(f"[Haystack Factory] Reusing existing processing pipeline with id: {id(self._processing_pipelines[organization_id])} for org: {organization_id}")
-        return self._processing_pipelines[organization_id]
+        # Delegate to the shared DocumentStoreManager for consistency.
+        # Steady-state hits are not worth an INFO line per document.
+        self.logger.debug(f"[Haystack Factory] Getting document store for org: {organization_id}")
+        return DocumentStoreManager().get_document_store(organization_id)
     
     @classmethod
     def get_instance_id(cls):
@@ -119,50 +178,43 @@ class IndexingPipelinesFactory:
         return {
             "total_organizations": store_stats["total_organizations"],
             "organizations": store_stats["organizations"],
-            "active_pipelines": len(self._processing_pipelines),
+            "active_pipelines": len(self._writers),
             "document_store_manager_id": store_stats["manager_instance_id"]
         }
     
-    def detect_file_type(self, file_path: str, object_path: str) -> DocumentType:
-        """Detect file type from extension"""
-        # Try by file extension
-        file_ext = Path(file_path).suffix.lower()
-        if file_ext in self.file_type_map:
-            return self.file_type_map[file_ext]
-        
-        # Try by object path extension
-        object_ext = Path(object_path).suffix.lower()
-        if object_ext in self.file_type_map:
-            return self.file_type_map[object_ext]
-        
-        # Default to TXT for unknown types
-        self.logger.warning(f"Unknown file type for {file_path}, defaulting to TXT")
-        return DocumentType.TXT
+    def detect_file_type(self, object_path: str) -> DocumentType:
+        """Detect file type from the object path extension (memoized)"""
+        return _detect_file_type(object_path)
     
-    def convert_document(self, file_path: str, doc_id: str, object_path: str) -> List[Document]:
-        """Convert document using appropriate native Haystack converter"""
-        doc_type = self.detect_file_type(file_path, object_path)
-        
+    def convert_document(self, file_bytes: bytes, doc_id: str, object_path: str,
+                         extra_meta: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Convert downloaded bytes using the appropriate native Haystack converter"""
+        doc_type = self.detect_file_type(object_path)
+
         # Base metadata for all documents
         base_meta = {
             "doc_id": doc_id,
             "object_path": object_path,
             "doc_type": doc_type.value,
             "source_file": object_path.split("/")[-1],
-            "file_size": os.path.getsize(file_path)
+            "file_size": len(file_bytes)
         }
-        
+        if extra_meta:
+            base_meta.update(extra_meta)
+
         self.logger.info(f"Converting document {doc_id} of type {doc_type.value}")
-        
+
+        # Converters accept in-memory ByteStreams, so the bytes never take a
+        # round-trip through a temp file on disk
+        mime_type = "application/pdf" if doc_type == DocumentType.PDF else "text/plain"
+        stream = ByteStream(data=file_bytes, mime_type=mime_type)
+
         try:
             # Use native Haystack converters - simplified for PDF and TXT only
             if doc_type == DocumentType.PDF:
-                documents = self.converters.convert_pdf(file_path)
-            elif doc_type == DocumentType.TXT:
-                documents = self.converters.convert_text(file_path)
+                documents = self.converters.convert_pdf(stream)
             else:
-                # Fallback to text for unknown types
-                documents = self.converters.convert_text(file_path)
+                documents = self.converters.convert_text(stream)
             # Update metadata for all documents
             for doc in documents:
                 if not hasattr(doc, 'meta') or doc.meta is None:
@@ -180,46 +232,165 @@ class IndexingPipelinesFactory:
                 meta=base_meta
             )]
     
-    def create_processing_pipeline(self, document_store) -> Pipeline:
-        """Create the document processing pipeline for a specific document store"""
-        haystack_config = configuration["haystack"]
-        
-        document_cleaner = DocumentCleaner(
-            remove_empty_lines=haystack_config["cleaner"]["remove_empty_lines"],
-            remove_extra_whitespaces=haystack_config["cleaner"]["remove_extra_whitespaces"],
-            remove_repeated_substrings=haystack_config["cleaner"]["remove_repeated_substrings"]
-        )
-        
-        document_splitter = DocumentSplitter(
-            split_by=haystack_config["splitter"]["split_by"],
-            split_length=haystack_config["splitter"]["split_length"],
-            split_overlap=haystack_config["splitter"]["split_overlap"]
-        )
-        
-        embedder = SentenceTransformersDocumentEmbedder(
-            model=haystack_config["embedder"]["model"],
-            progress_bar=haystack_config["embedder"]["progress_bar"]
-        )
-        
-        writer = DocumentWriter(
-            document_store=document_store,
-            policy=DuplicatePolicy.OVERWRITE
+    def _create_embedder(self):
+        """Build the configured embedder component (torch or onnx backend)."""
+        embedder_config = configuration["haystack"]["embedder"]
+
+        if embedder_config.get("backend") == "onnx":
+            # ONNX Runtime backend: graph-fused oneDNN kernels, typically
+            # 2-2.5x the CPU throughput of the eager PyTorch embedder
+            return OptimumDocumentEmbedder(
+                model=embedder_config["model"],
+                batch_size=embedder_config.get("batch_size", 32),
+                quantize=embedder_config.get("quantize", False)
+            )
+
+        # Optional reduced-precision weights (e.g. bfloat16): halves weight
+        # memory traffic and uses native low-precision matmuls on hardware
+        # that supports them (AVX512-BF16/AMX CPUs, Ampere+ GPUs)
+        model_kwargs = None
+        torch_dtype = embedder_config.get("torch_dtype")
+        if torch_dtype:
+            import torch
+            model_kwargs = {"torch_dtype": getattr(torch, torch_dtype)}
+
+        # Embedding is the ideal GPU batch workload: the same model runs
+        # 25-50x faster on a modest GPU than on CPU. "auto" picks cuda:0
+        # when available and stays on CPU otherwise.
+        device = None
+        device_str = embedder_config.get("device")
+        if device_str == "auto":
+            import torch
+            device_str = "cuda:0" if torch.cuda.is_available() else None
+        if device_str:
+            from haystack.utils import ComponentDevice
+            device = ComponentDevice.from_str(device_str)
+
+        return SentenceTransformersDocumentEmbedder(
+            model=embedder_config["model"],
+            progress_bar=embedder_config["progress_bar"],
+            batch_size=embedder_config.get("batch_size", 32),
+            model_kwargs=model_kwargs,
+            device=device
         )
-        
-        # Build pipeline
-        pipeline = Pipeline()
-        pipeline.add_component("cleaner", document_cleaner)
-        pipeline.add_component("splitter", document_splitter)
-        pipeline.add_component("embedder", embedder)
-        pipeline.add_component("writer", writer)
-        
-        # Connect components
-        pipeline.connect("cleaner", "splitter")
-        pipeline.connect("splitter", "embedder")
-        pipeline.connect("embedder", "writer")
-        
-        return pipeline
-    
+
+    def warm_up(self):
+        """Load the embedding model before the first task arrives.
+
+        Without this, each worker process stalls its first indexing task for
+        seconds while the model downloads and loads.
+        """
+        self.logger.info("[Haystack Factory] Warming up embedding model")
+        self._get_components()
+
+    def _get_components(self):
+        """Build the shared clean -> split -> sort -> embed components once.
+
+        Only the writer depends on the organization, so these four are
+        shared across every tenant; the embedding model loads here.
+        """
+        if self._components is None:
+            haystack_config = configuration["haystack"]
+
+            cleaner_config = haystack_config["cleaner"]
+            if cleaner_config["remove_repeated_substrings"]:
+                # Only DocumentCleaner implements repeated-substring removal
+                document_cleaner = DocumentCleaner(
+                    remove_empty_lines=cleaner_config["remove_empty_lines"],
+                    remove_extra_whitespaces=cleaner_config["remove_extra_whitespaces"],
+                    remove_repeated_substrings=True
+                )
+            else:
+                document_cleaner = FastCleaner(
+                    remove_empty_lines=cleaner_config["remove_empty_lines"],
+                    remove_extra_whitespaces=cleaner_config["remove_extra_whitespaces"]
+                )
+
+            document_splitter = DocumentSplitter(
+                split_by=haystack_config["splitter"]["split_by"],
+                split_length=haystack_config["splitter"]["split_length"],
+                split_overlap=haystack_config["splitter"]["split_overlap"]
+            )
+
+            embedder = self._create_embedder()
+
+            # Identical chunks (boilerplate across documents) skip re-embedding
+            cache_size = haystack_config["embedder"].get("cache_size", 10000)
+            if cache_size:
+                embedder = CachedDocumentEmbedder(embedder, cache_size=cache_size)
+            if hasattr(embedder, "warm_up"):
+                embedder.warm_up()
+
+            # The sorter groups similar-length chunks so each embedder batch
+            # is padded to a similar length (smart batching)
+            self._components = (document_cleaner, document_splitter, LengthSorter(), embedder)
+        return self._components
+
+    def _get_writer(self, organization_id: str) -> DocumentWriter:
+        """Get or create the per-organization document writer.
+
+        The store is re-resolved through the manager on every call: that
+        keeps an active tenant warm in the manager's LRU, and when the
+        store was evicted (its channel is closed) the identity check
+        rebuilds the writer against the fresh store instead of writing
+        through a dead handle.
+        """
+        store = self.get_document_store(organization_id)
+        cached = self._writers.get(organization_id)
+        if cached is not None and cached[0] is store:
+            return cached[1]
+        self.logger.info(f"[Haystack Factory] Creating document writer for org: {organization_id}")
+        writer = DocumentWriter(document_store=store, policy=DuplicatePolicy.OVERWRITE)
+        self._writers[organization_id] = (store, writer)
+        return writer
+
+    def _process_batch(self, documents: List[Document], organization_id: str) -> dict:
+        """Run clean -> split -> sort -> embed -> write as direct calls.
+
+        The topology is fixed, so Pipeline.run's per-component dict
+        unpacking, validation and repacking is pure overhead; calling the
+        components directly also exposes each step to profiling.
+        """
+        cleaner, splitter, sorter, embedder = self._get_components()
+        docs = cleaner.run(documents=documents)["documents"]
+        docs = splitter.run(documents=docs)["documents"]
+        docs = sorter.run(documents=docs)["documents"]
+        docs = embedder.run(documents=docs)["documents"]
+        return self._get_writer(organization_id).run(documents=docs)
+
+    def _stat_etag(self, object_path: str) -> Optional[str]:
+        """Fetch the MinIO etag for an object, or None if the stat fails."""
+        try:
+            return stat_object_etag(object_path)
+        except Exception as e:
+            self.logger.debug(f"[Haystack Factory] etag stat failed for {object_path}: {e}")
+            return None
+
+    def _already_indexed(self, doc_id: str, etag: str, organization_id: str) -> bool:
+        """Check whether doc_id is already indexed with this content etag.
+
+        One exact point count against Qdrant; any probe failure falls open
+        so a flaky check can never drop an ingestion.
+        """
+        try:
+            from qdrant_client.http import models as rest
+            manager = DocumentStoreManager()
+            # The manager's shared client, not the document store:
+            # QdrantDocumentStore keeps its client private and lazily
+            # initialized, so it has no usable handle before the first write
+            result = manager.get_client().count(
+                collection_name=manager.get_collection_name(organization_id),
+                count_filter=rest.Filter(must=[
+                    rest.FieldCondition(key="meta.doc_id", match=rest.MatchValue(value=doc_id)),
+                    rest.FieldCondition(key="meta.source_etag", match=rest.MatchValue(value=etag)),
+                ]),
+                exact=True
+            )
+            return result.count > 0
+        except Exception as e:
+            self.logger.debug(f"[Haystack Factory] duplicate probe failed for {doc_id}: {e}")
+            return False
+
     def run_indexing_pipeline(self, doc_id: str, object_path: str, user_id: str, organization_id: str):
         """
         Run the indexing pipeline using native Haystack converters
@@ -235,70 +406,129 @@ class IndexingPipelinesFactory:
             
         self.logger.info(f"[Haystack Factory] Starting indexing for {doc_id} (org: {organization_id}, user: {user_id})")
         self.logger.info(f"[Haystack Factory] Object path: {object_path}")
-        
+
         try:
-            # Step 1: Download from MinIO
+            # Step 0: Skip the whole embed-and-upsert run when this doc_id is
+            # already indexed with the same content (one cheap point count
+            # against Qdrant vs re-embedding every chunk)
+            etag = self._stat_etag(object_path)
+            if etag and self._already_indexed(doc_id, etag, organization_id):
+                self.logger.info(f"[Haystack Factory] {doc_id} already indexed with matching etag; skipping")
+                return {
+                    "status": "skipped",
+                    "doc_id": doc_id,
+                    "organization_id": organization_id,
+                    "user_id": user_id,
+                    "message": f"Document {doc_id} already indexed with unchanged content"
+                }
+
+            # Step 1: Download from MinIO straight into memory; the bytes go
+            # to the converters as a ByteStream without touching disk
             self.logger.info(f"[Haystack Factory] Downloading file...")
             file_bytes = download_file(object_path)
             self.logger.info(f"[Haystack Factory] Downloaded {len(file_bytes)} bytes")
-            
-            #TODO: Can we run pipeline with file_bytes instead of temp file?
-            # Step 2: Save to temporary file
-            file_extension = Path(object_path).suffix.lower() or '.txt'
-            with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as temp_file:
-                temp_file.write(file_bytes)
-                temp_file_path = temp_file.name
-            
-            try:
-                # Step 3: Convert document using native converters
-                documents = self.convert_document(temp_file_path, doc_id, object_path)
-                self.logger.info(f"[Haystack Factory] Converted to {len(documents)} document(s)")
-                
-                # Step 4: Process through organization-specific pipeline
-                if documents:
-                    # Add tenant context to document metadata
-                    for doc in documents:
-                        if not hasattr(doc, 'meta') or doc.meta is None:
-                            doc.meta = {}
-                        doc.meta.update({
-                            "user_id": user_id,
-                            "organization_id": organization_id
-                        })
-                    
-                    self.logger.info(f"[Haystack Factory] Using processing pipeline for org: {organization_id}")
-                    pipeline = self.get_processing_pipeline(organization_id)
-                    result = pipeline.run({"cleaner": {"documents": documents}})
-                    
-                    documents_written = result.get("writer", {}).get("documents_written", 0)
-                    self.logger.info(f"[Haystack Factory] Indexed {documents_written} chunks")
-                    
-                    tenancy_config = configuration["tenancy"]
-                    collection_name = f"{tenancy_config['organization_prefix']}-{organization_id}"
-                    
-                    return {
-                        "status": "success",
-                        "doc_id": doc_id,
-                        "organization_id": organization_id,
-                        "user_id": user_id,
-                        "doc_type": self.detect_file_type(temp_file_path, object_path).value,
-                        "documents_processed": len(documents),
-                        "chunks_created": documents_written,
-                        "collection": collection_name,
-                        "message": f"Successfully indexed {documents_written} chunks for organization {organization_id}"
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "doc_id": doc_id,
-                        "message": "No documents were extracted"
-                    }
-                    
-            finally:
-                # Clean up
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
-                    
+
+            # Step 2: Convert document using native converters, with tenant
+            # context folded into the base metadata so documents are only
+            # walked once; source_etag makes the duplicate probe work on
+            # the next run for this content
+            extra_meta = {"user_id": user_id, "organization_id": organization_id}
+            if etag:
+                extra_meta["source_etag"] = etag
+            documents = self.convert_document(
+                file_bytes, doc_id, object_path, extra_meta=extra_meta
+            )
+            self.logger.info(f"[Haystack Factory] Converted to {len(documents)} document(s)")
+
+            # Step 3: Process through the shared components and the
+            # organization-specific writer
+            if documents:
+                self.logger.info(f"[Haystack Factory] Processing batch for org: {organization_id}")
+                result = self._process_batch(documents, organization_id)
+
+                documents_written = result.get("documents_written", 0)
+                self.logger.info(f"[Haystack Factory] Indexed {documents_written} chunks")
+
+                tenancy_config = configuration["tenancy"]
+                collection_name = f"{tenancy_config['organization_prefix']}-{organization_id}"
+
+                return {
+                    "status": "success",
+                    "doc_id": doc_id,
+                    "organization_id": organization_id,
+                    "user_id": user_id,
+                    "doc_type": self.detect_file_type(object_path).value,
+                    "documents_processed": len(documents),
+                    "chunks_created": documents_written,
+                    "collection": collection_name,
+                    "message": f"Successfully indexed {documents_written} chunks for organization {organization_id}"
+                }
+            else:
+                return {
+                    "status": "error",
+                    "doc_id": doc_id,
+                    "message": "No documents were extracted"
+                }
+
         except Exception as e:
             self.logger.error(f"[Haystack Factory] Error processing {doc_id}: {e}")
             raise Exception(f"Failed to index document {doc_id}: {str(e)}")
 
+    def _download_and_convert(self, doc_id: str, object_path: str, user_id: str,
+                              organization_id: str) -> List[Document]:
+        """Download one object into memory and convert it to Documents."""
+        return self.convert_document(
+            download_file(object_path), doc_id, object_path,
+            extra_meta={"user_id": user_id, "organization_id": organization_id}
+        )
+
+    def run_indexing_pipeline_batch(self, jobs: List[Dict[str, str]], organization_id: str):
+        """
+        Index several documents for one organization in a single pipeline run.
+
+        Per-document processing feeds the embedder tiny, ragged batches and
+        its throughput collapses. Here downloads and conversions (I/O bound)
+        run in parallel threads, then every chunk goes through one combined
+        processing pass so the embedder sees full batches.
+
+        Args:
+            jobs: List of dicts with doc_id, object_path and user_id keys
+            organization_id: Organization ID (one batch spans one tenant)
+        """
+        if not organization_id:
+            raise ValueError("organization_id is required for multi-tenant indexing")
+        if not jobs:
+            return {"status": "error", "message": "No documents in batch"}
+
+        self.logger.info(f"[Haystack Factory] Starting batch indexing of {len(jobs)} document(s) (org: {organization_id})")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            converted = list(executor.map(
+                lambda job: self._download_and_convert(
+                    job["doc_id"], job["object_path"], job["user_id"], organization_id
+                ),
+                jobs
+            ))
+
+        documents = [doc for docs in converted for doc in docs]
+        if not documents:
+            return {"status": "error", "message": "No documents were extracted"}
+
+        result = self._process_batch(documents, organization_id)
+
+        documents_written = result.get("documents_written", 0)
+        self.logger.info(f"[Haystack Factory] Batch indexed {documents_written} chunks")
+
+        tenancy_config = configuration["tenancy"]
+        collection_name = f"{tenancy_config['organization_prefix']}-{organization_id}"
+
+        return {
+            "status": "success",
+            "organization_id": organization_id,
+            "doc_ids": [job["doc_id"] for job in jobs],
+            "documents_processed": len(documents),
+            "chunks_created": documents_written,
+            "collection": collection_name,
+            "message": f"Successfully indexed {documents_written} chunks for organization {organization_id}"
+        }
+
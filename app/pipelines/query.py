@@ -1,24 +1,161 @@
-from typing import List, Dict
-from haystack import Pipeline
-from haystack.components.routers import ConditionalRouter
+import asyncio
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterator, List, Dict
+
+import numpy as np
 from haystack.components.joiners import DocumentJoiner
 from haystack_integrations.components.generators.ollama import OllamaGenerator
-from haystack.components.builders import PromptBuilder
 
 # Qdrant retriever and embedder imports
 from haystack_integrations.components.retrievers.qdrant import QdrantEmbeddingRetriever
 from haystack.components.embedders import SentenceTransformersTextEmbedder
 
 # Import custom SQL components
-from app.pipelines.haystack_components import SQLGenerator, SQLQuery
+from app.pipelines.haystack_components import OptimumTextEmbedder, SQLGenerator, SQLQuery
+from app.pipelines.embedding_service import get_embedding_batcher
 from app.storage.document_store_manager import DocumentStoreManager
 
 import structlog
 from app.config_loader import configuration
 
+logger = structlog.get_logger(__name__)
+
+
+# Runs the SQL branch while the calling thread handles the docstore branch:
+# both are I/O-bound (Ollama HTTP, sqlite C layer, Qdrant RPC) and release
+# the GIL, so combined-target queries cost max(t_doc, t_sql) instead of
+# t_doc + t_sql
+_BRANCH_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="query-branch")
+
+# One module-level template instead of a Jinja PromptBuilder per tenant
+# pipeline; the document loop is a C-implemented str.join and the final
+# render a single str.format.
+#
+# Ordering matters for Ollama's KV cache: it reuses the longest common
+# token prefix across requests, so everything static sits before the first
+# variable slot — the instruction block is shared by every query in the
+# process, and its prefill is paid once per keep_alive window.
+_PROMPT_TEMPLATE = (
+    "You are a helpful assistant. Answer the question using only the "
+    "information in the provided context. If the context does not contain "
+    "the answer, say that you don't know rather than guessing.\n"
+    "\n"
+    "Context:\n"
+    "{context}\n"
+    "\n"
+    "Question: {query}\n"
+    "\n"
+    "Answer:"
+)
+
+
+@lru_cache(maxsize=4)
+def _get_shared_embedder(model: str, backend: str, quantize: bool):
+    """Process-wide query embedder, one instance per (model, backend) combo.
+
+    Transformer weights are read-only and identical across tenants, so every
+    pipeline holding its own embedder duplicated ~100 MB of weights per
+    organization for nothing. encode/forward are thread-safe post-warmup.
+    Sharing one instance also means all tenants feed the same embedding
+    batcher, so cross-tenant traffic batches together.
+    """
+    if backend == "onnx":
+        return OptimumTextEmbedder(model=model, quantize=quantize)
+    return SentenceTransformersTextEmbedder(model=model)
+
+
+def _generation_kwargs(llm_config: dict) -> dict:
+    """Ollama generation options shared by every LLM call the pipelines make.
+
+    Decode time is linear in generated tokens, so num_predict is capped;
+    keep_alive (passed separately) stops Ollama from unloading the model
+    between calls.
+    """
+    return {
+        "num_predict": llm_config.get("max_tokens", 256),
+        "num_ctx": llm_config.get("num_ctx", 4096),
+        "temperature": llm_config.get("temperature", 0.2),
+        "stop": ["\n\nQuestion:"],
+    }
+
+
+def _build_generator(llm_config: dict, **kwargs) -> OllamaGenerator:
+    """Construct an OllamaGenerator from an llm config dict."""
+    return OllamaGenerator(
+        model=llm_config["model"],
+        url=llm_config["base_url"],
+        generation_kwargs=_generation_kwargs(llm_config),
+        keep_alive=llm_config.get("keep_alive", "30m"),
+        **kwargs
+    )
+
+
+class SemanticCache:
+    """Cache of (query embedding, LLM reply) pairs matched by cosine similarity.
+
+    Semantically identical rephrasings of recent queries short-circuit the
+    retriever and the full autoregressive LLM decode — by far the dominant
+    per-query cost. Entries are scoped (organization, user, targets) so a
+    cached reply can never leak across tenant or retrieval-filter boundaries.
+
+    Vectors live structure-of-arrays style in one contiguous (capacity, D)
+    matrix per scope, preallocated once: inserts write a row in place and
+    recycle the oldest slot ring-buffer fashion, and — with the caller
+    L2-normalizing — the lookup is a single contiguous BLAS matrix-vector
+    product, never a vstack/delete reshuffle.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.95, max_entries: int = 1024):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        # scope -> {"matrix": (capacity, D) float32, "replies": [str]*capacity,
+        #           "count": filled rows, "next": slot to recycle}
+        self._scopes: Dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scope: tuple, embedding: np.ndarray) -> str | None:
+        """Return the cached reply for the nearest entry above threshold, or None."""
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is None:
+                return None
+            sims = entry["matrix"][:entry["count"]] @ embedding
+            best = int(np.argmax(sims))
+            if sims[best] < self.similarity_threshold:
+                return None
+            return entry["replies"][best]
+
+    def put(self, scope: tuple, embedding: np.ndarray, reply: str) -> None:
+        """Insert an entry, recycling the oldest slot once at capacity."""
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is None:
+                entry = {
+                    "matrix": np.empty((self.max_entries, embedding.shape[0]), dtype=np.float32),
+                    "replies": [None] * self.max_entries,
+                    "count": 0,
+                    "next": 0,
+                }
+                self._scopes[scope] = entry
+            slot = entry["next"]
+            entry["matrix"][slot] = embedding
+            entry["replies"][slot] = reply
+            entry["next"] = (slot + 1) % self.max_entries
+            if entry["count"] < self.max_entries:
+                entry["count"] += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries (used when a pipeline is evicted)."""
+        with self._lock:
+            self._scopes.clear()
+
 
 class QueryPipeline:
-    def __init__(self, db_conn_str: str, db_schema: str = "", llm_config: dict = None, qdrant_config: dict = None, embedder_config: dict = None, retriever_config: dict = None, organization_id: str = None):
+    def __init__(self, db_conn_str: str, db_schema: str = "", llm_config: dict = None, qdrant_config: dict = None, embedder_config: dict = None, retriever_config: dict = None, organization_id: str = None, semantic_cache_config: dict = None, generator: OllamaGenerator = None):
         
         if not llm_config:
             raise ValueError("llm_config is required")
@@ -33,144 +170,341 @@ class QueryPipeline:
         self.embedder_config = embedder_config
         self.retriever_config = retriever_config or {"top_k": 10}
         self.organization_id = organization_id
-        
-        # Build pipeline with organization-specific components if needed
-        self.pipeline = self.build_query_pipeline(db_conn_str=db_conn_str, db_schema=db_schema)
-        
-        # Pre-configure document store and retriever for this organization if specified
-        if organization_id:
-            self._setup_organization_retriever()
-
-    def build_query_pipeline(self, db_conn_str: str, db_schema: str = ""):
-        # Logic to build the query pipeline
-        pipe = Pipeline()
-
-        # Router: decides which branches to activate
-        routes = [
-            {
-                "condition": '{{ "docstore" in targets }}',
-                "output": "{{ query }}",
-                "output_name": "docstore",
-                "output_type": str
-            },
-            {
-                "condition": '{{ "sql" in targets }}',
-                "output": "{{ query }}",
-                "output_name": "sql", 
-                "output_type": str
-            }
-        ]
-        router = ConditionalRouter(routes=routes)
-        pipe.add_component("router", router)
-
-        # Docstore branch - Query embedder only (retriever will be added dynamically)
-        query_embedder = SentenceTransformersTextEmbedder(
-            model=self.embedder_config["model"]
+        # One generator (and one Ollama HTTP session) serves both the
+        # NL->SQL call and the final answer; the factory passes a
+        # process-wide instance so N tenants don't mean 2N clients
+        self.generator = generator or _build_generator(llm_config)
+
+        semantic_cache_config = semantic_cache_config or {}
+        self._semantic_cache = SemanticCache(
+            similarity_threshold=semantic_cache_config.get("similarity_threshold", 0.95),
+            max_entries=semantic_cache_config.get("max_entries", 1024),
         )
-        pipe.add_component("query_embedder", query_embedder)
-        
-        # Note: doc_retriever will be added dynamically in run_query method
+
+        # Retrievers cached per (organization_id, user_id): building a
+        # QdrantEmbeddingRetriever runs pydantic validation and client setup,
+        # which dwarfs the actual Qdrant RPC for small top_k queries
+        self._store_manager = DocumentStoreManager()
+        # Values are (document store, retriever): the store handle is kept
+        # so a manager-side eviction is detected by identity on lookup
+        self._retriever_cache: Dict[tuple, tuple] = {}
+        self._retriever_lock = threading.Lock()
+
+        # Build the components; they are called directly, so there is no
+        # Pipeline graph to walk
+        self._build_components(db_conn_str=db_conn_str, db_schema=db_schema)
+
+        # Concurrent queries share batched encoder forward passes instead of
+        # running the embedder once per request
+        self._embedding_batcher = get_embedding_batcher(self.query_embedder)
+
+        # Pre-build the document store and retriever for this organization so
+        # the first query doesn't pay Qdrant collection checks
+        if organization_id:
+            self._get_retriever(organization_id, None)
+
+        # Model loading (PyTorch weights, CUDA init, Ollama cold load) runs
+        # on a background thread so construction returns immediately;
+        # queries wait on the event instead of paying the cold start inline
+        self._warmed = threading.Event()
+        threading.Thread(target=self._warm_up, name="query-warmup", daemon=True).start()
+
+    def _warm_up(self):
+        """Load and exercise the models off the critical path.
+
+        One dummy embed forces weight materialization (and CUDA kernel JIT
+        where applicable); a one-token generate makes Ollama page the model
+        in under its keep_alive window. Failures are logged, not raised —
+        the first real query surfaces any persistent problem itself.
+        """
+        try:
+            if hasattr(self.query_embedder, "warm_up"):
+                self.query_embedder.warm_up()
+            self._embedding_batcher.embed("warmup")
+            self.generator.run(prompt="warmup", generation_kwargs={"num_predict": 1})
+        except Exception as exc:
+            logger.warning(f"[Query Pipeline] Warm-up failed (continuing cold): {exc}")
+        finally:
+            self._warmed.set()
+
+    def _build_components(self, db_conn_str: str, db_schema: str = ""):
+        """Construct the pipeline's components as plain attributes.
+
+        The topology is static (embed -> retrieve and/or NL->SQL -> execute,
+        then join -> prompt -> generate) and run_query wires it by hand, so
+        there is no Pipeline graph, no ConditionalRouter evaluating Jinja
+        conditions per request, and no per-component dict marshalling.
+        """
+        # Docstore branch - query embedder (retrievers are cached per tenant)
+        self.query_embedder = self._create_query_embedder()
 
         # SQL branch with NL->SQL generation
-        sql_generator = SQLGenerator(
+        self.sql_generator = SQLGenerator(
             model=self.llm_config["model"],
             base_url=self.llm_config["base_url"],
-            schema=db_schema
+            schema=db_schema,
+            llm=self.generator
         )
-        sql_exec = SQLQuery(
+        self.sql_exec = SQLQuery(
             conn_str=db_conn_str,
             llm_model=self.llm_config["model"],
             llm_base_url=self.llm_config["base_url"]
         )
-        pipe.add_component("sql_generator", sql_generator)
-        pipe.add_component("sql_exec", sql_exec)
 
-        # Joiner + Prompt Builder + Final LLM
-        joiner = DocumentJoiner()
-        prompt_builder = PromptBuilder(
-            template="""
-                Based on the following information, please answer the question:
+        # Joiner (the prompt renders from the module-level template and the
+        # final LLM is the shared self.generator)
+        self.joiner = DocumentJoiner()
 
-                Context:
-                {% for doc in documents %}
-                {{ doc.content }}
-                {% endfor %}
+    def _create_query_embedder(self):
+        """Get the shared query embedder for the configured backend.
 
-                Question: {{ query }}
-
-                Answer:
-                """,
-            required_variables=["documents", "query"]
+        Mirrors the indexing factory: "onnx" swaps in the Optimum/ONNX text
+        embedder (same exported model cache as the document side), anything
+        else keeps the eager PyTorch sentence-transformers path. The
+        instance is process-shared so N tenants hold one copy of the
+        weights.
+        """
+        return _get_shared_embedder(
+            self.embedder_config["model"],
+            self.embedder_config.get("backend", "torch"),
+            self.embedder_config.get("quantize", False),
         )
-        generator = OllamaGenerator(
-            model=self.llm_config["model"],
-            url=self.llm_config["base_url"]
+
+    def _get_retriever(self, organization_id: str, user_id: str = None) -> QdrantEmbeddingRetriever:
+        """Get or create the cached retriever for an (organization, user) pair.
+
+        The store is re-resolved through the manager on every call: that
+        keeps an active tenant warm in the manager's LRU, and when the
+        manager evicted the store (closing its channel) the identity check
+        rebuilds the retriever against the fresh store instead of querying
+        through a dead handle. The steady state stays a dict lookup plus
+        the manager's own fast path; construction happens under a lock so
+        concurrent first queries don't race.
+        """
+        key = (organization_id, user_id)
+        document_store = self._store_manager.get_document_store(organization_id)
+        cached = self._retriever_cache.get(key)
+        if cached is not None and cached[0] is document_store:
+            return cached[1]
+
+        with self._retriever_lock:
+            cached = self._retriever_cache.get(key)
+            if cached is None or cached[0] is not document_store:
+                # Metadata filters scoping retrieval to this organization.
+                # TODO: add a meta.user_id condition when user-level
+                # filtering is needed; the cache key already supports it
+                metadata_filters = {
+                    "operator": "AND",
+                    "conditions": [
+                        {
+                            "field": "meta.organization_id",
+                            "operator": "==",
+                            "value": organization_id
+                        }
+                    ]
+                }
+                retriever = QdrantEmbeddingRetriever(
+                    document_store=document_store,
+                    top_k=self.retriever_config.get("top_k"),
+                    filters=metadata_filters
+                )
+                self._retriever_cache[key] = (document_store, retriever)
+            else:
+                retriever = cached[1]
+        return retriever
+
+    def _check_semantic_cache(self, query: str, targets: List[str], organization_id: str, user_id: str):
+        """Embed the query (if the docstore branch applies) and probe the cache.
+
+        Returns (embedding, cache_scope, cached_reply); embedding is None when
+        the docstore branch is inactive, cached_reply is None on a miss.
+        """
+        # The docstore branch only exists on organization pipelines; the
+        # shared pipeline has no retriever to feed
+        use_docstore = "docstore" in targets and self.organization_id is not None
+        cache_scope = (
+            organization_id or self.organization_id,
+            user_id,
+            tuple(sorted(targets)),
         )
+        if not use_docstore:
+            return None, cache_scope, None
 
-        pipe.add_component("joiner", joiner)
-        pipe.add_component("prompt_builder", prompt_builder)
-        pipe.add_component("llm", generator)
+        embedding = np.asarray(self._embedding_batcher.embed(query), dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        if norm:
+            embedding /= norm
+        return embedding, cache_scope, self._semantic_cache.get(cache_scope, embedding)
 
-        # Wiring (doc_retriever connections will be added dynamically)
-        pipe.connect("router.docstore", "query_embedder.text")
-        pipe.connect("router.sql", "sql_generator.question")
+    def _run_sql_branch(self, query: str):
+        """NL->SQL generation followed by execution; returns result documents."""
+        sql = self.sql_generator.run(question=query)["sql"]
+        if not sql:
+            # Intent filter decided the question doesn't want SQL
+            return []
+        return self.sql_exec.run(query=sql)["documents"]
 
-        # Connect SQL generator to SQL executor
-        pipe.connect("sql_generator.sql", "sql_exec.query")
+    def _run_doc_branch(self, embedding, organization_id: str, user_id: str):
+        """Retrieve documents for a pre-computed, normalized query embedding."""
+        retriever = self._get_retriever(organization_id or self.organization_id, user_id)
+        return retriever.run(query_embedding=embedding.tolist())["documents"]
 
-        pipe.connect("sql_exec", "joiner.documents")
-        pipe.connect("joiner", "prompt_builder.documents")
-        pipe.connect("prompt_builder", "llm")
+    def _render_prompt(self, doc_lists: list, query: str) -> str:
+        """Join the branch results and render the final LLM prompt.
 
-        return pipe
+        Most queries activate a single branch; its documents pass straight
+        through, since DocumentJoiner's dedup/score-sort only matters when
+        two sources actually meet.
+        """
+        if len(doc_lists) == 1:
+            documents = doc_lists[0]
+        elif doc_lists:
+            documents = self.joiner.run(documents=doc_lists)["documents"]
+        else:
+            documents = []
+        context = "\n".join(doc.content or "" for doc in documents)
+        return _PROMPT_TEMPLATE.format(context=context, query=query)
 
-    def _setup_organization_retriever(self):
-        """Setup organization-specific document retriever for this pipeline."""
-        if not self.organization_id:
-            return
-            
-        store_manager = DocumentStoreManager()
-        document_store = store_manager.get_document_store(self.organization_id)
-        
-        # Create metadata filters for this organization
-        metadata_filters = {
-            "operator": "AND",
-            "conditions": [
-                {
-                    "field": "meta.organization_id",
-                    "operator": "==",
-                    "value": self.organization_id
-                }
-            ]
-        }
+    def _build_prompt(self, query: str, targets: List[str], embedding, organization_id: str, user_id: str) -> str:
+        """Run the retrieval branches (concurrently when both are requested)
+        and render the final LLM prompt."""
+        use_sql = "sql" in targets
+        sql_future = None
+        if use_sql and embedding is not None:
+            # Overlap the SQL branch (dominated by the NL->SQL LLM call)
+            # with the docstore branch running on this thread
+            sql_future = _BRANCH_EXECUTOR.submit(self._run_sql_branch, query)
 
-        # Create and add the retriever component
-        doc_retriever = QdrantEmbeddingRetriever(
-            document_store=document_store,
-            top_k=self.retriever_config.get("top_k"),
-            filters=metadata_filters
-        )
-        
-        # Add the retriever to the pipeline
-        self.pipeline.add_component("doc_retriever", doc_retriever)
-        # Connect the retriever in the pipeline
-        self.pipeline.connect("query_embedder.embedding", "doc_retriever.query_embedding")
-        # Connect to joiner
-        self.pipeline.connect("doc_retriever", "joiner.documents")
+        doc_lists = []
+        if embedding is not None:
+            doc_lists.append(self._run_doc_branch(embedding, organization_id, user_id))
+        if sql_future is not None:
+            doc_lists.append(sql_future.result())
+        elif use_sql:
+            doc_lists.append(self._run_sql_branch(query))
+
+        return self._render_prompt(doc_lists, query)
 
     def run_query(self, query: str, targets: List[str], organization_id: str = None, user_id: str = None) -> str:
-        """Execute query on this pipeline instance."""
-        # For organization-specific pipelines, we don't need to dynamically modify anything
-        # The pipeline is already configured for the specific organization
-        
+        """Execute query on this pipeline instance.
+
+        Components are driven directly instead of through Pipeline.run so the
+        query embedding is computed exactly once: it keys the semantic cache
+        and, on a miss, is handed straight to the retriever.
+        """
         # TODO: Implement user-level filtering when needed
         # For now, organization-level isolation is the primary concern
-        
-        result = self.pipeline.run({
-            "router": {"targets": targets, "query": query},
-            "prompt_builder": {"query": query}
-        })
-        return result["llm"]["replies"][0]
+
+        self._warmed.wait()
+        embedding, cache_scope, cached_reply = self._check_semantic_cache(
+            query, targets, organization_id, user_id
+        )
+        if cached_reply is not None:
+            return cached_reply
+
+        prompt = self._build_prompt(query, targets, embedding, organization_id, user_id)
+        reply = self.generator.run(prompt=prompt)["replies"][0]
+
+        if embedding is not None:
+            self._semantic_cache.put(cache_scope, embedding, reply)
+        return reply
+
+    async def run_query_async(self, query: str, targets: List[str], organization_id: str = None, user_id: str = None) -> str:
+        """Async variant of run_query for callers already on an event loop.
+
+        Each blocking section (embed, each retrieval branch, the final
+        generation) is offloaded to a worker thread individually and the
+        branches awaited with asyncio.gather, so the loop stays free to
+        interleave other requests during every HTTP/RPC wait instead of
+        parking one thread for the whole query.
+        """
+        await asyncio.to_thread(self._warmed.wait)
+        embedding, cache_scope, cached_reply = await asyncio.to_thread(
+            self._check_semantic_cache, query, targets, organization_id, user_id
+        )
+        if cached_reply is not None:
+            return cached_reply
+
+        branches = []
+        if embedding is not None:
+            branches.append(asyncio.to_thread(
+                self._run_doc_branch, embedding, organization_id, user_id
+            ))
+        if "sql" in targets:
+            branches.append(asyncio.to_thread(self._run_sql_branch, query))
+        doc_lists = list(await asyncio.gather(*branches))
+
+        prompt = self._render_prompt(doc_lists, query)
+        result = await asyncio.to_thread(self.generator.run, prompt=prompt)
+        reply = result["replies"][0]
+
+        if embedding is not None:
+            self._semantic_cache.put(cache_scope, embedding, reply)
+        return reply
+
+    def run_query_stream(self, query: str, targets: List[str], organization_id: str = None, user_id: str = None) -> Iterator[str]:
+        """Execute a query, yielding reply chunks as the LLM produces them.
+
+        Retrieval and prompt construction are identical to run_query; only
+        the generation differs, using a per-call OllamaGenerator with a
+        streaming callback so time-to-first-token is first-token latency
+        rather than full-generation latency. Semantic-cache hits yield the
+        whole cached reply at once; misses are cached after the stream ends.
+        """
+        self._warmed.wait()
+        embedding, cache_scope, cached_reply = self._check_semantic_cache(
+            query, targets, organization_id, user_id
+        )
+        if cached_reply is not None:
+            yield cached_reply
+            return
+
+        prompt = self._build_prompt(query, targets, embedding, organization_id, user_id)
+
+        # Generation runs in a worker thread; chunks cross over a queue so
+        # this generator yields them as the callback fires. A per-call
+        # generator instance is cheap (no model load) and keeps the callback
+        # bound to this call's queue.
+        chunk_queue: queue.Queue = queue.Queue()
+        sentinel = object()
+        generator = _build_generator(
+            self.llm_config,
+            streaming_callback=lambda chunk: chunk_queue.put(chunk.content),
+        )
+
+        def produce():
+            try:
+                generator.run(prompt=prompt)
+            except Exception as exc:
+                chunk_queue.put(exc)
+            finally:
+                chunk_queue.put(sentinel)
+
+        threading.Thread(target=produce, name="query-stream", daemon=True).start()
+
+        parts = []
+        while True:
+            item = chunk_queue.get()
+            if item is sentinel:
+                break
+            if isinstance(item, Exception):
+                raise item
+            parts.append(item)
+            yield item
+
+        if embedding is not None and parts:
+            self._semantic_cache.put(cache_scope, embedding, "".join(parts))
+
+    def close(self) -> None:
+        """Release per-tenant state when the factory evicts this pipeline.
+
+        Retrievers (and their Qdrant client references) and cached replies
+        are dropped; the generator, embedder and document stores are
+        process-shared and owned elsewhere, so they stay untouched.
+        """
+        with self._retriever_lock:
+            self._retriever_cache.clear()
+        self._semantic_cache.clear()
 
 
 class QueryPipelinesFactory:
@@ -194,8 +528,10 @@ class QueryPipelinesFactory:
             self.logger = structlog.get_logger(__name__)
             self.logger.info("[Query Factory] Initializing Multi-tenant Query Pipelines Factory")
             
-            # Multi-tenant storage: pipelines per organization
-            self._query_pipelines = {}  # org_id -> QueryPipeline
+            # Multi-tenant storage: pipelines per organization, bounded LRU
+            # so hundreds of cold tenants don't pin retrievers and reply
+            # caches in memory forever
+            self._query_pipelines = OrderedDict()  # org_id -> QueryPipeline
             self._shared_pipeline = None  # Shared pipeline for non-tenant specific operations (SQL)
             
             # Load configuration once
@@ -204,10 +540,16 @@ class QueryPipelinesFactory:
             self.qdrant_config = configuration.get("qdrant", {})
             self.haystack_config = configuration.get("haystack", {})
             self.query_config = configuration.get("query", {})
-            
+            self._max_pipelines = self.query_config.get("max_cached_pipelines", 64)
+
             # Validate required configuration
             self._validate_configuration()
-            
+
+            # One Ollama generator (model handle + HTTP session) for the
+            # whole process; every tenant pipeline and the SQL branch share
+            # it, so Ollama sees one keep_alive'd model instead of 2N clients
+            self._shared_generator = _build_generator(self.llm_config)
+
             # Create shared pipeline for SQL queries and other non-tenant operations
             self._shared_pipeline = self._create_pipeline_for_organization(None)
             
@@ -237,7 +579,11 @@ class QueryPipelinesFactory:
         # LLM configuration for Ollama
         llm_settings = {
             "model": self.llm_config["model"],
-            "base_url": self.llm_config["base_url"]
+            "base_url": self.llm_config["base_url"],
+            "max_tokens": self.llm_config.get("max_tokens", 256),
+            "num_ctx": self.llm_config.get("num_ctx", 4096),
+            "temperature": self.llm_config.get("temperature", 0.2),
+            "keep_alive": self.llm_config.get("keep_alive", "30m")
         }
         
         # Qdrant configuration
@@ -248,7 +594,9 @@ class QueryPipelinesFactory:
         
         # Embedder configuration
         embedder_settings = {
-            "model": self.haystack_config["embedder"]["model"]
+            "model": self.haystack_config["embedder"]["model"],
+            "backend": self.haystack_config["embedder"].get("backend", "torch"),
+            "quantize": self.haystack_config["embedder"].get("quantize", False)
         }
         
         # Retriever configuration
@@ -263,7 +611,9 @@ class QueryPipelinesFactory:
             qdrant_config=qdrant_settings,
             embedder_config=embedder_settings,
             retriever_config=retriever_settings,
-            organization_id=organization_id
+            organization_id=organization_id,
+            semantic_cache_config=self.query_config.get("semantic_cache", {}),
+            generator=self._shared_generator
         )
     
     def get_shared_pipeline(self) -> QueryPipeline:
@@ -273,13 +623,21 @@ class QueryPipelinesFactory:
     
     def get_organization_pipeline(self, organization_id: str) -> QueryPipeline:
         """Get or create query pipeline for a specific organization."""
-        if organization_id not in self._query_pipelines:
+        pipeline = self._query_pipelines.get(organization_id)
+        if pipeline is None:
             self.logger.info(f"[Query Factory] Creating query pipeline for org: {organization_id}")
-            self._query_pipelines[organization_id] = self._create_pipeline_for_organization(organization_id)
+            if len(self._query_pipelines) >= self._max_pipelines:
+                evicted_org, evicted = self._query_pipelines.popitem(last=False)
+                evicted.close()
+                self.logger.info(f"[Query Factory] Evicted cold query pipeline for org: {evicted_org}")
+            pipeline = self._create_pipeline_for_organization(organization_id)
+            self._query_pipelines[organization_id] = pipeline
         else:
-            self.logger.info(f"[Query Factory] Reusing existing query pipeline with id: {id(self._query_pipelines[organization_id])} for org: {organization_id}")
-        
-        return self._query_pipelines[organization_id]
+            # Refresh LRU position on hit
+            self._query_pipelines.move_to_end(organization_id)
+            self.logger.debug(f"[Query Factory] Reusing existing query pipeline with id: {id(pipeline)} for org: {organization_id}")
+
+        return pipeline
     
     @classmethod
     def get_instance_id(cls):
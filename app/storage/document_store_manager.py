@@ -4,6 +4,11 @@ Shared Document Store Manager
 This module provides a centralized way to manage QdrantDocumentStore instances
 for multi-tenant applications, avoiding tight coupling between indexing and query pipelines.
 """
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict
 from haystack_integrations.document_stores.qdrant import QdrantDocumentStore
 from qdrant_client import QdrantClient
@@ -11,6 +16,12 @@ from qdrant_client.http import models as rest
 from app.config_loader import configuration
 
 
+@lru_cache(maxsize=1024)
+def _collection_name(prefix: str, organization_id: str) -> str:
+    """Memoized tenant collection name; built on every store lookup path."""
+    return f"{prefix}-{organization_id}"
+
+
 class DocumentStoreManager:
     """
     Centralized manager for QdrantDocumentStore instances.
@@ -29,13 +40,72 @@ class DocumentStoreManager:
     
     def __init__(self):
         if not self._initialized:
-            self._document_stores: Dict[str, QdrantDocumentStore] = {}
+            # LRU of per-org stores: each one holds a Qdrant channel, so an
+            # unbounded dict leaks file descriptors as tenants accumulate
+            self._document_stores: "OrderedDict[str, QdrantDocumentStore]" = OrderedDict()
+            # One QdrantClient per URL, shared by existence checks and
+            # collection admin; building a client per call re-handshakes
+            # the (gRPC) channel every time
+            self._qdrant_clients: Dict[str, QdrantClient] = {}
+            # Guards first-touch creation of stores and clients in the
+            # threaded worker pool; steady-state reads stay lock-free
+            self._lock = threading.Lock()
             self._config = configuration
+            # Hot sub-configs pulled out once; every store lookup path
+            # otherwise re-indexes the top-level config dict
+            self._qdrant_cfg = self._config["qdrant"]
+            self._org_prefix = self._config["tenancy"]["organization_prefix"]
+            self._max_stores = self._qdrant_cfg.get("max_cached_stores", 256)
+            # Short-TTL snapshot of collection names; a cold burst of store
+            # creations then costs one get_collections round-trip instead
+            # of one existence probe per org
+            self._known_collections = None
+            self._known_collections_ts = 0.0
             DocumentStoreManager._initialized = True
-    
+
+    def get_client(self) -> QdrantClient:
+        """Shared admin client for the configured Qdrant URL.
+
+        For callers that need raw point-level operations (counts, scrolls)
+        the document store doesn't expose; QdrantDocumentStore keeps its
+        own client private and lazily initialized, so it is not a usable
+        handle for this.
+        """
+        return self._get_client(self._qdrant_cfg["url"])
+
+    def get_collection_name(self, organization_id: str) -> str:
+        """Tenant collection name for an organization."""
+        return _collection_name(self._org_prefix, organization_id)
+
+    def _get_client(self, url: str) -> QdrantClient:
+        """Get or create the shared QdrantClient for a Qdrant URL."""
+        client = self._qdrant_clients.get(url)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._qdrant_clients.get(url)
+            if client is None:
+                qdrant_config = self._qdrant_cfg
+                client = QdrantClient(
+                    url=url,
+                    prefer_grpc=qdrant_config.get("prefer_grpc", True),
+                    grpc_port=qdrant_config.get("grpc_port", 6334)
+                )
+                self._qdrant_clients[url] = client
+        return client
+
+    def _collections_set(self, client: QdrantClient, ttl: float = 30.0) -> set:
+        """Return the set of known collection names, refreshed when stale."""
+        if self._known_collections is None or time.monotonic() - self._known_collections_ts > ttl:
+            self._known_collections = {
+                collection.name for collection in client.get_collections().collections
+            }
+            self._known_collections_ts = time.monotonic()
+        return self._known_collections
+
     def _is_auto_create_enabled(self) -> bool:
         """Check if auto collection creation is enabled."""
-        return self._config["qdrant"].get("auto_create_collection", True)
+        return self._qdrant_cfg.get("auto_create_collection", True)
     
     def get_document_store(self, organization_id: str) -> QdrantDocumentStore:
         """
@@ -47,10 +117,46 @@ class DocumentStoreManager:
         Returns:
             QdrantDocumentStore instance for the organization
         """
-        if organization_id not in self._document_stores:
-            self._document_stores[organization_id] = self._create_document_store(organization_id)
-        
-        return self._document_stores[organization_id]
+        # Single-lookup fast path for the steady state
+        store = self._document_stores.get(organization_id)
+        if store is not None:
+            try:
+                self._document_stores.move_to_end(organization_id)
+                return store
+            except KeyError:
+                # Raced an eviction on another thread: the handle we just
+                # read is closed, so fall through and rebuild under the lock
+                pass
+        # Double-checked creation: without the lock two concurrent first
+        # touches for the same org would each open a Qdrant channel
+        with self._lock:
+            store = self._document_stores.get(organization_id)
+            if store is None:
+                store = self._create_document_store(organization_id)
+                while len(self._document_stores) >= self._max_stores:
+                    _, evicted = self._document_stores.popitem(last=False)
+                    self._close_store(evicted)
+                self._document_stores[organization_id] = store
+            else:
+                self._document_stores.move_to_end(organization_id)
+        return store
+
+    @staticmethod
+    def _close_store(store: QdrantDocumentStore) -> None:
+        """Close a store's Qdrant channel.
+
+        The store's client is private and lazily initialized; when it was
+        never touched there is no channel to close. Only the close() call
+        itself is shielded, so a renamed attribute fails loudly instead of
+        silently leaking channels.
+        """
+        client = store._client
+        if client is None:
+            return
+        try:
+            client.close()
+        except Exception:
+            pass  # Channel already torn down; nothing left to leak
     
     def _create_document_store(self, organization_id: str) -> QdrantDocumentStore:
         """
@@ -62,23 +168,19 @@ class DocumentStoreManager:
         Returns:
             Configured QdrantDocumentStore instance
         """
-        qdrant_config = self._config["qdrant"]
-        tenancy_config = self._config["tenancy"]
-        collection_name = f"{tenancy_config['organization_prefix']}-{organization_id}"
-        
+        qdrant_config = self._qdrant_cfg
+        collection_name = _collection_name(self._org_prefix, organization_id)
+
         # Check if auto collection creation is disabled
         if not self._is_auto_create_enabled():
             # Verify collection exists before creating document store
-            client = QdrantClient(url=qdrant_config["url"])
+            client = self._get_client(qdrant_config["url"])
             try:
-                # Check if collection exists
-                collections = client.get_collections()
-                collection_exists = any(
-                    collection.name == collection_name 
-                    for collection in collections.collections
-                )
-                
-                if not collection_exists:
+                # Snapshot membership answers most checks without a network
+                # round-trip; a miss falls back to a direct probe so a
+                # collection created within the TTL isn't rejected
+                if (collection_name not in self._collections_set(client)
+                        and not client.collection_exists(collection_name)):
                     raise ValueError(
                         f"Collection '{collection_name}' does not exist."
                     )
@@ -94,9 +196,18 @@ class DocumentStoreManager:
             url=qdrant_config["url"],
             index=collection_name,
             embedding_dim=qdrant_config["embedding_dim"],
-            recreate_index=qdrant_config["recreate_index"],
+            # recreate_index stays at its False default on purpose: wired to
+            # config it was one misconfigured flag away from wiping a
+            # tenant's collection on every cold store lookup. Rebuilds go
+            # through the explicit recreate_collection admin path.
             return_embedding=qdrant_config["return_embedding"],
-            wait_result_from_api=qdrant_config["wait_result_from_api"]
+            # wait_result_from_api=False acks upserts before indexing
+            # finishes, so the writer doesn't serialize the pipeline on
+            # Qdrant durability; gRPC + large write batches cut round-trips
+            wait_result_from_api=qdrant_config["wait_result_from_api"],
+            prefer_grpc=qdrant_config.get("prefer_grpc", True),
+            grpc_port=qdrant_config.get("grpc_port", 6334),
+            write_batch_size=qdrant_config.get("write_batch_size", 100)
         )
     
     def list_organizations(self) -> list[str]:
@@ -121,16 +232,15 @@ class DocumentStoreManager:
         Returns:
             Dictionary with creation status and details
         """
-        tenancy_config = self._config["tenancy"]
-        qdrant_config = self._config["qdrant"]
-        collection_name = f"{tenancy_config['organization_prefix']}-{organization_id}"
-        
+        qdrant_config = self._qdrant_cfg
+        collection_name = _collection_name(self._org_prefix, organization_id)
+
         try:
-            # Create collection directly using Qdrant client first
-            client = QdrantClient(url=qdrant_config["url"])
+            # Create collection directly using the shared Qdrant client
+            client = self._get_client(qdrant_config["url"])
             
             # Check if collection already exists
-            try:
+            if client.collection_exists(collection_name):
                 collection_info = client.get_collection(collection_name)
                 return {
                     "success": True,
@@ -141,42 +251,42 @@ class DocumentStoreManager:
                     "vectors_count": collection_info.vectors_count,
                     "status": collection_info.status.name if hasattr(collection_info.status, 'name') else str(collection_info.status)
                 }
-            except Exception:
-                # Collection doesn't exist, create it
-                try:
-                    client.create_collection(
-                        collection_name=collection_name,
-                        vectors_config=rest.VectorParams(
-                            size=qdrant_config["embedding_dim"],
-                            distance=rest.Distance.COSINE
-                        )
+            # Collection doesn't exist, create it
+            try:
+                client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=rest.VectorParams(
+                        size=qdrant_config["embedding_dim"],
+                        distance=rest.Distance.COSINE
                     )
+                )
+                if self._known_collections is not None:
+                    self._known_collections.add(collection_name)
+                return {
+                    "success": True,
+                    "message": f"Collection {collection_name} created successfully",
+                    "collection_name": collection_name,
+                    "organization_id": organization_id,
+                    "points_count": 0,
+                    "vectors_count": 0,
+                    "status": "created"
+                }
+            except Exception as create_error:
+                # If collection already exists, that's fine (lost a
+                # create race with another worker)
+                if "already exists" in str(create_error):
+                    collection_info = client.get_collection(collection_name)
                     return {
                         "success": True,
-                        "message": f"Collection {collection_name} created successfully",
+                        "message": f"Collection {collection_name} already exists",
                         "collection_name": collection_name,
                         "organization_id": organization_id,
-                        "points_count": 0,
-                        "vectors_count": 0,
-                        "status": "created"
+                        "points_count": collection_info.points_count,
+                        "vectors_count": collection_info.vectors_count,
+                        "status": collection_info.status.name if hasattr(collection_info.status, 'name') else str(collection_info.status)
                     }
-                except Exception as create_error:
-                    # If collection already exists, that's fine
-                    if "already exists" in str(create_error):
-                        collection_info = client.get_collection(collection_name)
-                        return {
-                            "success": True,
-                            "message": f"Collection {collection_name} already exists",
-                            "collection_name": collection_name,
-                            "organization_id": organization_id,
-                            "points_count": collection_info.points_count,
-                            "vectors_count": collection_info.vectors_count,
-                            "status": collection_info.status.name if hasattr(collection_info.status, 'name') else str(collection_info.status)
-                        }
-                    else:
-                        raise create_error
-            
-                
+                else:
+                    raise create_error
         except Exception as e:
             return {
                 "success": False,
@@ -186,6 +296,40 @@ class DocumentStoreManager:
                 "error": str(e)
             }
     
+    def recreate_collection(self, organization_id: str) -> dict:
+        """Drop and recreate an organization's collection (admin only).
+
+        Destructive: deletes every point in the tenant's collection. Gated
+        behind RETINA_ALLOW_RECREATE_COLLECTION=1 so it can never run from
+        a misconfigured production process.
+        """
+        collection_name = _collection_name(self._org_prefix, organization_id)
+        if os.getenv("RETINA_ALLOW_RECREATE_COLLECTION") != "1":
+            return {
+                "success": False,
+                "message": "Collection recreation is disabled; set RETINA_ALLOW_RECREATE_COLLECTION=1 to enable",
+                "collection_name": collection_name,
+                "organization_id": organization_id
+            }
+        client = self._get_client(self._qdrant_cfg["url"])
+        try:
+            if client.collection_exists(collection_name):
+                client.delete_collection(collection_name)
+            if self._known_collections is not None:
+                self._known_collections.discard(collection_name)
+            # Drop the cached store so the next lookup binds to the fresh
+            # collection, then reuse the normal create path
+            self.remove_document_store(organization_id)
+            return self.create_collection(organization_id)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Failed to recreate collection {collection_name}: {str(e)}",
+                "collection_name": collection_name,
+                "organization_id": organization_id,
+                "error": str(e)
+            }
+
     def remove_document_store(self, organization_id: str) -> bool:
         """
         Remove document store for an organization (useful for cleanup).
@@ -196,7 +340,9 @@ class DocumentStoreManager:
         Returns:
             True if removed, False if not found
         """
-        if organization_id in self._document_stores:
-            del self._document_stores[organization_id]
+        with self._lock:
+            store = self._document_stores.pop(organization_id, None)
+        if store is not None:
+            self._close_store(store)
             return True
         return False
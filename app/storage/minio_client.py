@@ -1,3 +1,5 @@
+import shutil
+from contextlib import contextmanager
 from datetime import timedelta
 from minio import Minio
 from app.config_loader import configuration
@@ -9,11 +11,18 @@ client = Minio(
     secure=configuration["minio"]["secure"],
 )
 
+# Buckets verified (or created) by this process; buckets are never
+# deleted at runtime, so one existence check per bucket is enough and
+# every later presigned URL skips the round-trip to MinIO
+_known_buckets: set = set()
+
 def generate_presigned_upload_url(object_name: str, expiry_minutes: int = 10) -> str:
     bucket = configuration["minio"]["bucket"]
 
-    if not client.bucket_exists(bucket):
-        client.make_bucket(bucket)
+    if bucket not in _known_buckets:
+        if not client.bucket_exists(bucket):
+            client.make_bucket(bucket)
+        _known_buckets.add(bucket)
 
     return client.presigned_put_object(
         bucket,
@@ -21,26 +30,75 @@ def generate_presigned_upload_url(object_name: str, expiry_minutes: int = 10) ->
         expires=timedelta(minutes=expiry_minutes),
     )
 
+def stat_object_etag(object_path: str) -> str:
+    """Return the etag of a MinIO object (object_path = bucket/object_name).
+
+    The etag changes whenever the object's content does, so it serves as a
+    cheap content fingerprint without downloading the object.
+    """
+    bucket, object_name = object_path.split("/", 1)
+    return client.stat_object(bucket, object_name).etag
+
+@contextmanager
+def open_download(object_path: str):
+    """Open a MinIO object as a streaming file-like handle.
+
+    Yields the underlying HTTP response, which supports read()/stream()
+    so the caller can consume the object chunk by chunk without ever
+    materializing it; the connection is released when the context exits
+    (object_path = bucket/object_name).
+    """
+    bucket, object_name = object_path.split("/", 1)
+    response = client.get_object(bucket, object_name)
+    try:
+        yield response
+    finally:
+        response.close()
+        response.release_conn()
+
 def download_file(object_path: str) -> bytes:
     """Download file from MinIO (object_path = bucket/object_name)."""
     bucket, object_name = object_path.split("/", 1)
     response = client.get_object(bucket, object_name)
-    return response.read()
+    try:
+        return response.read()
+    finally:
+        response.close()
+        response.release_conn()
+
+def download_file_to(object_path: str, fileobj) -> int:
+    """Stream a MinIO object into fileobj in 1 MiB chunks.
+
+    Unlike download_file this never holds the whole object in memory, so
+    peak RSS stays bounded regardless of file size. Returns the number of
+    bytes written (object_path = bucket/object_name).
+    """
+    bucket, object_name = object_path.split("/", 1)
+    response = client.get_object(bucket, object_name)
+    try:
+        start = fileobj.tell()
+        shutil.copyfileobj(response, fileobj, length=1024 * 1024)
+        return fileobj.tell() - start
+    finally:
+        response.close()
+        response.release_conn()
 
 def create_bucket(bucket_name: str) -> dict:
     """Create a new bucket in MinIO if it doesn't exist."""
     try:
         # Check if bucket already exists
         if client.bucket_exists(bucket_name):
+            _known_buckets.add(bucket_name)
             return {
                 "status": "exists",
                 "message": f"Bucket '{bucket_name}' already exists",
                 "bucket_name": bucket_name
             }
-        
+
         # Create the bucket
         client.make_bucket(bucket_name)
-        
+        _known_buckets.add(bucket_name)
+
         return {
             "status": "created",
             "message": f"Bucket '{bucket_name}' created successfully",
@@ -0,0 +1,35 @@
+"""Bounded Celery worker health probe.
+
+The four broadcast RPCs (ping/stats/active/reserved) each fan out to every
+worker and wait for a timeout, so issuing them serially costs up to four
+full timeout windows when workers are stuck. Here a single inspect handle
+with a short timeout is shared and the four calls overlap on a thread
+pool, bounding the probe's wall time to roughly one timeout.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from app.workers.ingestion_tasks import celery_app
+
+
+def check_worker_health(timeout: float = 1.0) -> dict:
+    """Collect ping/stats/active/reserved from all workers in one round.
+
+    Args:
+        timeout: Per-broadcast reply window in seconds; slow or hung
+            workers are simply absent from the result instead of stalling
+            the probe.
+
+    Returns:
+        Dict with ping, stats, active and reserved keys (each the usual
+        per-worker mapping, or None when no worker replied).
+    """
+    inspect = celery_app.control.inspect(timeout=timeout)
+    probes = {
+        "ping": inspect.ping,
+        "stats": inspect.stats,
+        "active": inspect.active,
+        "reserved": inspect.reserved,
+    }
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {name: executor.submit(probe) for name, probe in probes.items()}
+        return {name: future.result() for name, future in futures.items()}